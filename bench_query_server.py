@@ -0,0 +1,76 @@
+"""Local load-generation benchmark for query_server.py"""
+from __future__ import annotations
+
+import argparse
+import http.client
+import random
+import threading
+import time
+
+from query_server import DefaultsIndex, make_server
+
+
+def _client(port: int, paths: list[str], n: int, revalidate: bool,
+            latencies: list[float]):
+    conn = http.client.HTTPConnection('127.0.0.1', port)
+    etags = {}
+    rng = random.Random()
+    for _ in range(n):
+        path = rng.choice(paths)
+        headers = {'If-None-Match': etags[path]} if revalidate and path in etags else {}
+        start = time.perf_counter()
+        conn.request('GET', path, headers=headers)
+        resp = conn.getresponse()
+        resp.read()
+        latencies.append(time.perf_counter() - start)
+        if (etag := resp.getheader('ETag')) is not None:
+            etags[path] = etag
+    conn.close()
+
+
+def _make_paths(index: DefaultsIndex) -> list[str]:
+    paths = ['/widgets']
+    for name, options in index.widgets.items():
+        paths.append(f'/widget/{name}')
+        paths.extend(f'/widget/{name}/{opt}' for opt in options)
+    return paths
+
+
+def run_bench(n_clients=8, n_requests=2_000, revalidate=False):
+    index = DefaultsIndex()
+    server = make_server(port=0, index=index, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    paths = _make_paths(index)
+    latencies: list[float] = []
+    per_client = n_requests // n_clients
+    clients = [threading.Thread(target=_client, args=(
+        server.server_port, paths, per_client, revalidate, latencies))
+        for _ in range(n_clients)]
+    start = time.perf_counter()
+    for c in clients:
+        c.start()
+    for c in clients:
+        c.join()
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+    server.server_close()
+    latencies.sort()
+    total = len(latencies)
+    print(f'{"revalidating" if revalidate else "plain"}: {total} requests, '
+          f'{n_clients} clients in {elapsed:.3f}s = {total / elapsed:.0f} req/s, '
+          f'p50={latencies[total // 2] * 1e3:.3f}ms, '
+          f'p99={latencies[int(total * 0.99)] * 1e3:.3f}ms')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-c', '--clients', type=int, default=8)
+    parser.add_argument('-n', '--requests', type=int, default=2_000)
+    args = parser.parse_args()
+    run_bench(args.clients, args.requests, revalidate=False)
+    run_bench(args.clients, args.requests, revalidate=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Startup benchmark for cli.py, using `python -X importtime`"""
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# (name, cli args)
+DEFAULT_INVOCATIONS = (
+    ('help', ('--help',)),
+    ('query', ('query', 'Button', 'anchor')),
+    ('diff', ('diff', 'merged_defaults/concise.json', 'merged_defaults/concise.json')),
+    ('merge', ('merge',)),
+)
+HEAVY_MODULES = ('tkinter', '_tkinter', 'inspect')
+# These write to the tree so are run in a scratch copy of the data dirs
+WRITING_COMMANDS = {'merge'}
+DATA_DIRS = ('tkinter_defaults', 'ttk_defaults', 'merged_defaults',
+             'ttk_merged_defaults', 'stub_defaults')
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Return {module: self time in us} from the -X importtime output"""
+    out = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _cumulative, name = line[len('import time:'):].split('|')
+        out[name.strip()] = int(self_us)
+    return out
+
+
+def _make_scratch_tree(dest: Path):
+    for name in DATA_DIRS:
+        if Path(name).is_dir():
+            shutil.copytree(name, dest / name)
+
+
+def bench_one(args: tuple[str, ...], repeat: int,
+              cwd: Path | None = None) -> tuple[float, dict[str, int]]:
+    """Return (best wall time in s, imports of the last run)"""
+    best = float('inf')
+    imports = {}
+    env = None
+    if cwd is not None:  # cli etc. still need to be importable
+        env = {**os.environ, 'PYTHONPATH': os.pathsep.join(
+            filter(None, (os.getcwd(), os.getenv('PYTHONPATH'))))}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        proc = subprocess.run((sys.executable, '-X', 'importtime', '-m', 'cli', *args),
+                              capture_output=True, text=True, cwd=cwd, env=env)
+        best = min(best, time.perf_counter() - start)
+        imports = parse_importtime(proc.stderr)
+    return best, imports
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    args = parser.parse_args()
+    for name, cli_args in DEFAULT_INVOCATIONS:
+        if cli_args[0] in WRITING_COMMANDS:
+            with tempfile.TemporaryDirectory(prefix='tk_defaults_bench_') as d:
+                _make_scratch_tree(Path(d))
+                wall, imports = bench_one(cli_args, args.repeat, Path(d))
+        else:
+            wall, imports = bench_one(cli_args, args.repeat)
+        heavy = [m for m in HEAVY_MODULES if m in imports]
+        print(f'{name:>6}: wall={wall * 1e3:7.1f}ms  '
+              f'imports={sum(imports.values()) / 1e3:6.1f}ms ({len(imports)} modules)  '
+              f'heavy imports: {", ".join(heavy) or "none"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Check that the alternative merge paths give the same result as merge_dir():
+the external merge and its value index (at a small memory budget, so it spills
+many runs) and watch mode's incremental merge (as snapshots are added, changed
+and removed)."""
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from merge_defaults import merge_data, merge_dir, read_snapshots, snapshot_paths
+from merge_external import merge_files_external
+from utils import readfile_json
+from value_index import INDEX_NAME, IndexBuilder, build_index
+from watch_defaults import IncrementalMerger
+
+SNAPSHOT_DIRS = (Path('./tkinter_defaults'), Path('./ttk_defaults'))
+BUDGETS = (1_000, 50_000)  # bytes
+
+
+def check_external(defaults_dir: Path) -> list[str]:
+    expected_index = IndexBuilder()
+    expected = merge_dir(defaults_dir, external=False, index=expected_index)
+    expected_index = expected_index.build()
+    problems = []
+    for budget in BUDGETS:
+        index = IndexBuilder()
+        if merge_files_external(snapshot_paths(defaults_dir), budget, index=index) != expected:
+            problems.append(f'{defaults_dir}: external merge (budget={budget}) differs from merge_dir()')
+        if index.build() != expected_index:
+            problems.append(f'{defaults_dir}: external value index (budget={budget}) differs')
+    return problems
+
+
+def check_incremental(defaults_dir: Path) -> list[str]:
+    paths = sorted(snapshot_paths(defaults_dir))
+    problems = []
+    with tempfile.TemporaryDirectory(prefix='tk_defaults_check_') as d:
+        snap_dir, out_dir = Path(d) / 'snapshots', Path(d) / 'merged'
+        snap_dir.mkdir()
+        for p in paths[:len(paths) // 2]:
+            shutil.copy(p, snap_dir)
+        merger = IncrementalMerger('check', snap_dir, out_dir, sharded=False)
+        merger.full_merge()
+
+        def check(step: str):
+            merger.poll()
+            merger.update()
+            snapshots = read_snapshots(snap_dir)
+            if merger.merged != merge_data(*snapshots.values()):
+                problems.append(f'{defaults_dir}: incremental merge differs after {step}')
+            if readfile_json(out_dir / INDEX_NAME) != build_index(snapshots.items()):
+                problems.append(f'{defaults_dir}: value index is stale after {step}')
+
+        for p in paths[len(paths) // 2:]:
+            shutil.copy(p, snap_dir)
+            check(f'adding {p.name}')
+        if paths:  # same data as an existing snapshot, from a new platform
+            shutil.copy(paths[0], snap_dir / 'default0__NewPlatform-X.json')
+            check('adding a duplicate from a new platform')
+        if len(paths) >= 2:
+            changed = snap_dir / paths[0].name
+            shutil.copy(paths[-1], changed)
+            st = changed.stat()  # make sure the change is seen within mtime resolution
+            os.utime(changed, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            check(f'changing {changed.name}')
+            (snap_dir / paths[-1].name).unlink()
+            check(f'removing {paths[-1].name}')
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.parse_args()
+    problems = [p for d in SNAPSHOT_DIRS for p in check_external(d) + check_incremental(d)]
+    for p in problems:
+        print(p)
+    if problems:
+        sys.exit(1)
+    print('All merges agree')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""Single entry point for collecting, ingesting, merging and querying the defaults.
+
+Each subsystem is only imported when its subcommand runs, so e.g. `merge`
+never imports tkinter."""
+from __future__ import annotations
+
+import argparse
+import sys
+
+
+def cmd_collect(args: argparse.Namespace):
+    if not args.ttk_only:
+        import write_curr_defaults
+        print('Gathering and writing tkinter defaults...')
+        write_curr_defaults.run()
+    if not args.tkinter_only:
+        from get_ttk_defaults import write_curr_ttk_defaults
+        print('Gathering and writing ttk defaults...')
+        write_curr_ttk_defaults.run()
+
+
+def cmd_probe(args: argparse.Namespace):
+    import probe_engine
+    probe_engine.run(args.plugins or None)
+
+
+def cmd_ingest(_args: argparse.Namespace):
+    import write_downloaded_artifacts
+    from get_ttk_defaults import write_downloaded_ttk_artifacts
+    print('Writing downloaded tkinter artifacts...')
+    write_downloaded_artifacts.main()
+    print('Writing downloaded ttk artifacts...')
+    write_downloaded_ttk_artifacts.main()
+
+
+def cmd_merge(args: argparse.Namespace):
+    import gen_stub_defaults
+    import merge_defaults
+    from get_ttk_defaults import merge_ttk_defaults
+    print('Merging tkinter defaults...')
+    merge_defaults.merge_defaults(args.sharded, args.external)
+    print('Merging ttk defaults...')
+    merge_ttk_defaults.merge_defaults(args.sharded, args.external)
+    print('Regenerating stub defaults...')
+    print(f'Re-rendered {gen_stub_defaults.generate()} widgets')
+
+
+def cmd_diff(args: argparse.Namespace):
+    import json
+    from utils import readfile_json
+    a, b = readfile_json(args.a), readfile_json(args.b)
+    n_diff = 0
+    for widget in sorted(a.keys() | b.keys()):
+        wa, wb = a.get(widget, {}), b.get(widget, {})
+        for opt in sorted(wa.keys() | wb.keys()):
+            va = json.dumps(wa[opt]) if opt in wa else '<missing>'
+            vb = json.dumps(wb[opt]) if opt in wb else '<missing>'
+            if va != vb:
+                print(f'{widget}.{opt}: {va} -> {vb}')
+                n_diff += 1
+    print(f'{n_diff} differences')
+    return 1 if n_diff else 0
+
+
+def cmd_query(args: argparse.Namespace):
+    import json
+    from query_server import DefaultsIndex
+    data = DefaultsIndex().widget(args.widget, args.platform)
+    if data is not None and args.option is not None:
+        data = data.get(args.option)
+    if data is None:
+        print('Not found', file=sys.stderr)
+        return 1
+    print(json.dumps(data, indent=2, sort_keys=True))
+
+
+def cmd_values(args: argparse.Namespace):
+    from value_index import ValueIndex, print_postings
+    index = ValueIndex()
+    if args.prefix:
+        postings = index.prefix(args.query)
+    elif args.type:
+        postings = index.of_type(args.query)
+    else:
+        postings = index.exact(args.query)
+    print_postings(postings)
+    return 0 if postings else 1
+
+
+def cmd_serve(args: argparse.Namespace):
+    from query_server import make_server
+    server = make_server(port=args.port)
+    print(f'Serving merged defaults on http://127.0.0.1:{server.server_port}/')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def cmd_watch(args: argparse.Namespace):
+    import watch_defaults
+    try:
+        watch_defaults.watch(watch_defaults.default_mergers(args.sharded))
+    except KeyboardInterrupt:
+        pass
+
+
+def cmd_cluster(args: argparse.Namespace):
+    import cluster_snapshots
+    for d in cluster_snapshots.SNAPSHOT_DIRS:
+        cluster_snapshots.report(d, args.threshold)
+
+
+def make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m cli', description=__doc__)
+    sub = parser.add_subparsers(dest='cmd', required=True)
+
+    p = sub.add_parser('collect', help='find the defaults on this machine')
+    group = p.add_mutually_exclusive_group()
+    group.add_argument('--tkinter-only', action='store_true')
+    group.add_argument('--ttk-only', action='store_true')
+    p.set_defaults(func=cmd_collect)
+
+    p = sub.add_parser('probe', help='probe all the plugins in one Tk session and '
+                                     'write their snapshot trees')
+    p.add_argument('plugins', nargs='*', help='default: all registered plugins')
+    p.set_defaults(func=cmd_probe)
+
+    p = sub.add_parser('ingest', help='write downloaded CI artifacts to the snapshot dirs')
+    p.set_defaults(func=cmd_ingest)
+
+    p = sub.add_parser('merge', help='merge the tkinter and ttk snapshots and regenerate the stub defaults')
+    p.add_argument('--sharded', action='store_true', default=None,
+                   help='also write per-widget shards')
+    p.add_argument('--external', action='store_true', default=None,
+                   help='use the bounded-memory merge')
+    p.set_defaults(func=cmd_merge)
+
+    p = sub.add_parser('diff', help='show the options that differ between two files')
+    p.add_argument('a')
+    p.add_argument('b')
+    p.set_defaults(func=cmd_diff)
+
+    p = sub.add_parser('cluster', help='report clusters of near-duplicate snapshots')
+    p.add_argument('-t', '--threshold', type=float, default=0.9)
+    p.set_defaults(func=cmd_cluster)
+
+    p = sub.add_parser('query', help='print the merged defaults of a widget')
+    p.add_argument('widget')
+    p.add_argument('option', nargs='?')
+    p.add_argument('--platform', help='only merge snapshots from matching platforms')
+    p.set_defaults(func=cmd_query)
+
+    p = sub.add_parser('values', help='find the widgets/options with a default value')
+    p.add_argument('query')
+    group = p.add_mutually_exclusive_group()
+    group.add_argument('-p', '--prefix', action='store_true', help='values starting with query')
+    group.add_argument('-t', '--type', action='store_true', help='values of type query')
+    p.set_defaults(func=cmd_values)
+
+    p = sub.add_parser('serve', help='run the HTTP query server')
+    p.add_argument('--port', type=int, default=8765)
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser('watch', help='re-merge as new snapshots land')
+    p.add_argument('--sharded', action='store_true', default=None)
+    p.set_defaults(func=cmd_watch)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = make_parser().parse_args(argv)
+    return args.func(args) or 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,170 @@
+"""Find clusters of near-duplicate snapshots using MinHash signatures.
+
+Each snapshot's signature is computed over its (widget, option, value)
+triples and cached by the snapshot's digest. Candidate pairs come from
+LSH banding of the signatures (so there is no all-pairs comparison) and
+are kept if their estimated Jaccard similarity is above the threshold.
+The banding is chosen from the threshold so pairs at the threshold are
+almost always candidates."""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+from pathlib import Path
+
+from merge_defaults import snapshot_paths
+from utils import file_digest, file_lock, readfile_json, writefile_json, JsonT
+
+SNAPSHOT_DIRS = (Path('./tkinter_defaults'), Path('./ttk_defaults'))
+CACHE_PATH = Path('./.cache/minhash_signatures.json')
+NUM_PERM = 128
+SEED = 1
+DEFAULT_THRESHOLD = 0.9
+# Minimum probability that a pair at the threshold becomes a candidate
+MIN_RECALL = 0.99
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(SEED)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+
+def _triple_hashes(data: dict[str, dict[str, JsonT]]) -> set[int]:
+    out = set()
+    for widget, options in data.items():
+        for opt, value in options.items():
+            s = f'{widget}\0{opt}\0{json.dumps(value, sort_keys=True)}'
+            h = hashlib.blake2b(s.encode('utf8'), digest_size=8).digest()
+            out.add(int.from_bytes(h, 'little'))
+    return out
+
+
+def minhash_signature(data: dict[str, dict[str, JsonT]]) -> list[int]:
+    xs = _triple_hashes(data)
+    if not xs:
+        return [_PRIME] * NUM_PERM
+    return [min((a * x + b) % _PRIME for x in xs) for a, b in _PERMS]
+
+
+def estimate_jaccard(sig_a: list[int], sig_b: list[int]) -> float:
+    return sum(a == b for a, b in zip(sig_a, sig_b)) / len(sig_a)
+
+
+def _read_cache() -> dict[str, list[int]]:
+    if CACHE_PATH.exists():
+        cache = readfile_json(CACHE_PATH)
+        if cache.get('num_perm') == NUM_PERM and cache.get('seed') == SEED:
+            return cache['signatures']
+    return {}
+
+
+def get_signatures(paths: list[Path]) -> dict[Path, list[int]]:
+    """Signatures of the snapshots, only computing those not in the cache"""
+    CACHE_PATH.parent.mkdir(exist_ok=True)
+    with file_lock(CACHE_PATH):
+        cache = _read_cache()
+        out = {}
+        n_new = 0
+        for path in paths:
+            digest = file_digest(path)
+            if (sig := cache.get(digest)) is None:
+                sig = cache[digest] = minhash_signature(readfile_json(path))
+                n_new += 1
+            out[path] = sig
+        if n_new:
+            writefile_json(CACHE_PATH, {'num_perm': NUM_PERM, 'seed': SEED,
+                                        'signatures': cache}, indent=None)
+    return out
+
+
+def candidate_probability(similarity: float, bands: int, rows: int) -> float:
+    return 1 - (1 - similarity ** rows) ** bands
+
+
+def choose_banding(threshold: float) -> tuple[int, int]:
+    """Return (bands, rows) with the most rows (so fewest false candidates)
+    that still makes pairs at `threshold` candidates with >= MIN_RECALL"""
+    if not 0 < threshold <= 1:
+        raise ValueError(f'threshold must be in (0, 1], got {threshold}')
+    for rows in sorted((r for r in range(1, NUM_PERM + 1) if NUM_PERM % r == 0), reverse=True):
+        if candidate_probability(threshold, NUM_PERM // rows, rows) >= MIN_RECALL:
+            return NUM_PERM // rows, rows
+    p = candidate_probability(threshold, NUM_PERM, 1)
+    print(f'##[warn]WARN: threshold {threshold} is too low for LSH: pairs at the '
+          f'threshold only have a {p:.0%} chance of being found', file=sys.stderr)
+    return NUM_PERM, 1
+
+
+def _candidate_pairs(sigs: dict[Path, list[int]], bands: int, rows: int
+                     ) -> set[tuple[Path, Path]]:
+    pairs = set()
+    for band in range(bands):
+        buckets: dict[tuple[int, ...], list[Path]] = {}
+        for path, sig in sigs.items():
+            buckets.setdefault(tuple(sig[band * rows:(band + 1) * rows]), []).append(path)
+        for members in buckets.values():
+            pairs.update((a, b) for i, a in enumerate(members) for b in members[i + 1:])
+    return pairs
+
+
+def cluster(sigs: dict[Path, list[int]], threshold=DEFAULT_THRESHOLD) -> list[list[Path]]:
+    """Return clusters (of 2+ snapshots), linking pairs with similarity >= threshold"""
+    parent = {p: p for p in sigs}
+
+    def find(p: Path) -> Path:
+        while parent[p] != p:
+            parent[p] = parent[parent[p]]
+            p = parent[p]
+        return p
+
+    bands, rows = choose_banding(threshold)
+    for a, b in _candidate_pairs(sigs, bands, rows):
+        if estimate_jaccard(sigs[a], sigs[b]) >= threshold:
+            parent[find(a)] = find(b)
+    groups: dict[Path, list[Path]] = {}
+    for p in sigs:
+        groups.setdefault(find(p), []).append(p)
+    return sorted((sorted(g) for g in groups.values() if len(g) > 1), key=lambda g: g[0])
+
+
+def differing_options(paths: list[Path]) -> dict[tuple[str, str], list[JsonT]]:
+    """The exact (widget, option)s that differ between the snapshots,
+    with the value in each snapshot ('<missing>' if it isn't there)"""
+    datas = [readfile_json(p) for p in paths]
+    keys = {(w, opt) for d in datas for w, opts in d.items() for opt in opts}
+    out = {}
+    for w, opt in sorted(keys):
+        values = [d.get(w, {}).get(opt, '<missing>') for d in datas]
+        if any(v != values[0] for v in values):
+            out[(w, opt)] = values
+    return out
+
+
+def report(directory: Path, threshold=DEFAULT_THRESHOLD):
+    sigs = get_signatures(sorted(snapshot_paths(directory)))
+    clusters = cluster(sigs, threshold)
+    print(f'{directory}: {len(sigs)} snapshots, {len(clusters)} clusters '
+          f'of near-duplicates (similarity >= {threshold})')
+    for i, paths in enumerate(clusters):
+        print(f'  Cluster {i} ({len(paths)} snapshots):')
+        for j, p in enumerate(paths):
+            print(f'    [{j}] {p.name}')
+        diff = differing_options(paths)
+        if not diff:
+            print('    (identical)')
+        for (w, opt), values in diff.items():
+            print(f'    {w}.{opt}: ' + ', '.join(f'[{j}]={json.dumps(v)}' for j, v in enumerate(values)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-t', '--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+    for d in SNAPSHOT_DIRS:
+        report(d, args.threshold)
+
+
+if __name__ == '__main__':
+    main()
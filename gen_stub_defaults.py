@@ -0,0 +1,116 @@
+"""Render the merged defaults as default values for the options in
+typeshed's tkinter/__init__.pyi and tkinter/ttk.pyi.
+
+Each widget's rendered block is cached by a digest of its merged data
+so a regeneration only re-renders widgets whose merged data changed."""
+from __future__ import annotations
+
+import json
+import keyword
+from pathlib import Path
+
+from merge_defaults import _is_different_values, _is_type_diff, _get_obj_data
+from probe_variants import is_variant_key
+from utils import (atomic_writefile, file_lock, readfile, readfile_json, writefile_json,
+                   json_digest, JsonT)
+
+MERGED_FILES = (Path('./merged_defaults/details.json'),
+                Path('./ttk_merged_defaults/details.json'))
+OUT_DIR = Path('./stub_defaults')
+CACHE_PATH = OUT_DIR / '.cache.json'
+CACHE_VERSION = 1
+
+# widget prefix -> (output file, module it corresponds to in typeshed)
+STUB_FILES = {'': ('__init__.pyi', 'tkinter/__init__.pyi'),
+              'ttk.': ('ttk.pyi', 'tkinter/ttk.pyi')}
+
+
+def _stub_key(widget: str) -> str:
+    return 'ttk.' if widget.startswith('ttk.') else ''
+
+
+def render_default(v: JsonT) -> str:
+    """Return the default as it should appear in the stub (... if it differs)"""
+    if _is_different_values(v):
+        return '...'
+    if _is_type_diff(v):
+        return _render_str_value(v[1])
+    if isinstance(v, str):
+        return _render_str_value(_get_obj_data(v).value)
+    if isinstance(v, (bool, int, float)) or v is None:
+        return repr(v)
+    return '...'
+
+
+def _render_str_value(s: str) -> str:
+    try:
+        return str(int(s))
+    except ValueError:
+        return json.dumps(s)  # double quotes like the rest of typeshed
+
+
+def render_widget(widget: str, data: dict[str, JsonT]) -> str:
+    cls_name = widget[len(_stub_key(widget)):]
+    lines = [f'class {cls_name}:']
+    for opt in sorted(data):
+        v = data[opt]
+        comment = f'  # {v[0]}' if _is_different_values(v) or _is_type_diff(v) else ''
+        name = opt + '_' if keyword.iskeyword(opt) else opt  # class -> class_
+        lines.append(f'    {name} = {render_default(v)}{comment}')
+    return '\n'.join(lines) + '\n'
+
+
+def _read_cache() -> dict[str, dict[str, str]]:
+    if not CACHE_PATH.exists():
+        return {}
+    cache = readfile_json(CACHE_PATH)
+    if cache.get('version') != CACHE_VERSION:
+        return {}
+    return cache['widgets']
+
+
+def _read_merged() -> dict[str, dict[str, JsonT]]:
+    merged = {}
+    for path in MERGED_FILES:
+        if path.exists():
+            merged.update(readfile_json(path))
+    return merged
+
+
+def generate(merged: dict[str, dict[str, JsonT]] | None = None) -> int:
+    """Regenerate the stub default files. Returns number of widgets re-rendered"""
+    if merged is None:
+        merged = _read_merged()
+    OUT_DIR.mkdir(exist_ok=True)
+    with file_lock(CACHE_PATH):
+        old_cache = _read_cache()
+        new_cache = {}
+        n_rendered = 0
+        for widget, data in merged.items():
+            if is_variant_key(widget):
+                continue  # depends on constructor options so not a static default
+            digest = json_digest(data)
+            if (entry := old_cache.get(widget)) is None or entry['digest'] != digest:
+                entry = {'digest': digest, 'rendered': render_widget(widget, data)}
+                n_rendered += 1
+            new_cache[widget] = entry
+        for key, (filename, stub_name) in STUB_FILES.items():
+            blocks = [new_cache[w]['rendered'] for w in sorted(new_cache)
+                      if _stub_key(w) == key]
+            content = (f'# Default option values for typeshed\'s {stub_name}\n'
+                       f'# Generated by gen_stub_defaults.py from the merged defaults\n\n'
+                       + '\n\n'.join(blocks))
+            path = OUT_DIR / filename
+            if not path.exists() or readfile(path) != content:
+                atomic_writefile(path, content)
+        writefile_json(CACHE_PATH, {'version': CACHE_VERSION, 'widgets': new_cache})
+    return n_rendered
+
+
+def main():
+    n = generate()
+    print(f'Re-rendered {n} widgets')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-import platform
-import sys
 from os import PathLike
 from pathlib import Path
 
-from get_ttk_defaults.get_ttk_defaults import defaults_str
-from utils import json_str_eq
+from get_ttk_defaults.get_ttk_defaults import PLUGIN, defaults_str
+from probe_engine import IncompleteProbeError
+from utils import atomic_writefile
+from write_curr_defaults import write_incomplete_snapshot, write_snapshot
 
 DEBUG = 1
+DEFAULTS_DIR = Path('./ttk_defaults')
 
 
 def debug(msg: str, always=False, level=1):
@@ -17,65 +18,23 @@ def debug(msg: str, always=False, level=1):
 
 
 def _writefile(path: str | PathLike, content: str, mode='w'):
+    if mode == 'w':
+        return atomic_writefile(path, content)
     with open(path, mode) as f:
         f.write(content)
 
 
-def _readfile(path: str | PathLike, mode='r') -> str:
-    assert 'w' not in mode
-    with open(path, mode) as f:
-        return f.read()
-
-
-def get_py_key():
-    ver_key = f'{sys.version_info.major}.{sys.version_info.minor}'
-    return f'{platform.python_implementation()}-{ver_key}'
-
-
-def get_arch_key():
-    return f'{get_py_key()}_{platform.platform()}'
-
-
-OUT_PATH_FMT = 'ttk_defaults/default{n}__{plat}.json'
-
-
-def _find_available_path(result: str, check_overwrite=True) -> tuple[Path, Path | None]:
-    """Return tuple of (path of result [NOT None], path to write to [or None])"""
-    def get_out_path():
-        return Path(OUT_PATH_FMT.format(n=n, plat=plat))
-
-    plat = get_arch_key()
-    n = 0
-    out_path = get_out_path()
-    if not check_overwrite:
-        return out_path, out_path
-    while n < 1_000:
-        if not out_path.exists():
-            print(f'[DEBUG] Found space at {n=}')
-            return out_path, out_path  # free path, write here
-        orig = _readfile(out_path)
-        if json_str_eq(orig, result):
-            # same result so no write but still return path to find it at
-            print(f'[DEBUG] Found matching at {n=}')
-            return out_path, None
-        print(f'[DEBUG] Compared to {n=}, no match')
-        n += 1
-        out_path = get_out_path()
-    raise TimeoutError("Checked 1000 paths, none available. "
-                       "Exiting to avoid excessive CPU/disk consumption. "
-                       "(should never be THIS many of a single platform)")
-
-
 def run(check_overwrite=True):
-    defaults_s = defaults_str()
+    try:
+        defaults_s = defaults_str()
+    except IncompleteProbeError as e:
+        path = write_incomplete_snapshot(DEFAULTS_DIR, e.results[PLUGIN.name])
+        debug(f'##[warn]WARN: Probe was incomplete, partial defaults are in {path}',
+              always=True)
+        raise
     debug('INFO: Writing defaults locally')
     _writefile('ttk_defaults_curr.json', defaults_s)
-    res_path, out_path = _find_available_path(defaults_s, check_overwrite)
-    if out_path is not None:
-        debug('INFO: Writing defaults to ttk_defaults/')
-        _writefile(out_path, defaults_s)
-    else:
-        debug('INFO: No write to ttk_defaults/ needed (same as existing info)')
+    res_path = write_snapshot(DEFAULTS_DIR, defaults_s, check_overwrite)
     debug('Writing ttk_curr_out_filename.txt')
     _writefile('ttk_curr_out_filename.txt', content=res_path.name)
 
@@ -0,0 +1,159 @@
+"""Index of when each merged default changed, read straight from the git
+objects (no checkouts). Updates only process commits since the last update."""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+from collections import OrderedDict
+from pathlib import Path
+
+from utils import file_lock, readfile_json, writefile_json, JsonT
+
+TRACKED_PATHS = ('merged_defaults/details.json', 'ttk_merged_defaults/details.json')
+INDEX_PATH = Path('./.timeline_index.json')
+INDEX_VERSION = 1
+REMOVED = '@removed'
+BLOB_CACHE_SIZE = 8
+
+ZERO_SHA = '0' * 40
+
+
+def _git(*args: str) -> str:
+    return subprocess.run(('git', *args), check=True, capture_output=True,
+                          text=True, encoding='utf8').stdout
+
+
+def _is_ancestor(commit: str, ref: str) -> bool:
+    return subprocess.run(('git', 'merge-base', '--is-ancestor', commit, ref),
+                          capture_output=True).returncode == 0
+
+
+class BlobReader:
+    """Reads blobs through one long-running `git cat-file --batch` process,
+    keeping the last few parsed blobs so re-seen blobs aren't re-read."""
+
+    def __init__(self):
+        self._proc = subprocess.Popen(('git', 'cat-file', '--batch'),
+                                      stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        self._cache: OrderedDict[str, dict[tuple[str, str], JsonT]] = OrderedDict()
+
+    def read_flat(self, blob: str) -> dict[tuple[str, str], JsonT]:
+        if blob == ZERO_SHA:
+            return {}
+        if (flat := self._cache.get(blob)) is not None:
+            self._cache.move_to_end(blob)
+            return flat
+        data = json.loads(self._read_raw(blob))
+        flat = {(w, opt): v for w, opts in data.items() for opt, v in opts.items()}
+        self._cache[blob] = flat
+        if len(self._cache) > BLOB_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return flat
+
+    def _read_raw(self, blob: str) -> bytes:
+        self._proc.stdin.write(blob.encode('ascii') + b'\n')
+        self._proc.stdin.flush()
+        header = self._proc.stdout.readline().split()
+        if len(header) != 3:
+            raise LookupError(f'git cat-file: {b" ".join(header).decode()}')
+        content = self._proc.stdout.read(int(header[2]))
+        self._proc.stdout.read(1)  # trailing newline
+        return content
+
+    def close(self):
+        self._proc.stdin.close()
+        self._proc.wait()
+
+
+def _changes_since(since: str | None, ref: str) -> list[tuple[str, dict[str, str]]]:
+    """Return [(commit, {path: new_blob})] for first-parent commits that
+    changed any of the tracked paths, oldest first."""
+    rev_range = ref if since is None else f'{since}..{ref}'
+    out = _git('log', '--reverse', '--first-parent', '-m', '--format=%H',
+               '--raw', '--no-abbrev', '--no-renames', rev_range, '--', *TRACKED_PATHS)
+    changes = []
+    for line in out.splitlines():
+        if not line:
+            continue
+        if not line.startswith(':'):
+            changes.append((line, {}))
+            continue
+        meta, path = line.split('\t', 1)
+        new_blob = meta.split()[3]
+        changes[-1][1][path] = new_blob
+    return [c for c in changes if c[1]]
+
+
+def _empty_index() -> dict:
+    return {'version': INDEX_VERSION, 'commit': None,
+            'heads': {p: ZERO_SHA for p in TRACKED_PATHS}, 'timeline': {}}
+
+
+def read_index() -> dict:
+    if INDEX_PATH.exists():
+        index = readfile_json(INDEX_PATH)
+        if index.get('version') == INDEX_VERSION:
+            return index
+    return _empty_index()
+
+
+def update_index(ref='HEAD') -> int:
+    """Process only the commits since the last update. Returns number processed"""
+    with file_lock(INDEX_PATH):
+        index = read_index()
+        head = _git('rev-parse', ref).strip()
+        if index['commit'] is not None and not _is_ancestor(index['commit'], head):
+            print('History was rewritten, rebuilding timeline index')
+            index = _empty_index()
+        changes = _changes_since(index['commit'], head)
+        reader = BlobReader()
+        try:
+            for commit, new_blobs in changes:
+                for path, blob in new_blobs.items():
+                    old_blob = index['heads'].get(path, ZERO_SHA)
+                    if blob == old_blob:
+                        continue
+                    _record_diff(index['timeline'], commit,
+                                 reader.read_flat(old_blob), reader.read_flat(blob))
+                    index['heads'][path] = blob
+        finally:
+            reader.close()
+        index['commit'] = head
+        writefile_json(INDEX_PATH, index, indent=None)
+    return len(changes)
+
+
+def _record_diff(timeline: dict, commit: str, old: dict[tuple[str, str], JsonT],
+                 new: dict[tuple[str, str], JsonT]):
+    for key in old.keys() | new.keys():
+        value = new.get(key, REMOVED)
+        if old.get(key, REMOVED) == value:
+            continue
+        widget, opt = key
+        timeline.setdefault(widget, {}).setdefault(opt, []).append([commit, value])
+
+
+def get_history(widget: str, option: str) -> list[tuple[str, JsonT]]:
+    return [(c, v) for c, v in read_index()['timeline'].get(widget, {}).get(option, [])]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    p_update = sub.add_parser('update', help='index new commits')
+    p_update.add_argument('ref', nargs='?', default='HEAD')
+    p_show = sub.add_parser('show', help='show the changes of one option')
+    p_show.add_argument('widget')
+    p_show.add_argument('option')
+    args = parser.parse_args()
+    if args.cmd == 'update':
+        n = update_index(args.ref)
+        print(f'Processed {n} new commits')
+    else:
+        for commit, value in get_history(args.widget, args.option):
+            print(f'{commit[:12]}  {json.dumps(value)}')
+
+
+if __name__ == '__main__':
+    main()
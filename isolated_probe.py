@@ -0,0 +1,143 @@
+"""Probe each class in a pool of long-lived worker processes (each with its
+own Tk root) so a class that hangs or crashes the interpreter only costs
+its deadline instead of stalling the whole run. A worker that times out
+or dies is replaced and the class is recorded in the partial results."""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+
+DEFAULT_DEADLINE = 30.0  # seconds per class (and for a worker to start up)
+DEFAULT_WORKERS = 2
+
+
+def _worker_main(plugin_name: str, conn: Connection):
+    import probe_engine
+    from tkinter import TclError
+    plugin = probe_engine.get_plugin(plugin_name)
+    temp_root = probe_engine.get_temp_root()
+    if plugin.setup is not None:
+        try:
+            plugin.setup(temp_root)
+        except (TclError, ImportError) as e:
+            conn.send(('setup_failed', f'{type(e).__name__}: {e!s}'))
+            return
+    conn.send(None)  # ready
+    while (name := conn.recv()) is not None:
+        try:
+            defaults = plugin.probe_class(name, temp_root)
+            conn.send(('ok', None if defaults is None else {
+                k: probe_engine.make_value_serializable(v) for k, v in defaults.items()}))
+        except Exception as e:
+            conn.send(('error', f'{type(e).__name__}: {e!s}'))
+    if temp_root is not None:
+        temp_root.destroy()
+
+
+@dataclass
+class ProbeResult:
+    defaults: dict[str, dict] = field(default_factory=dict)
+    timed_out: list[str] = field(default_factory=list)
+    crashed: list[str] = field(default_factory=list)
+    errors: dict[str, str] = field(default_factory=dict)
+    skipped: str | None = None  # why the plugin's setup failed (nothing was probed)
+
+    @property
+    def failures(self) -> dict[str, str]:
+        """{class: why it's missing}, empty if every class was probed"""
+        return {**{name: 'timeout' for name in self.timed_out},
+                **{name: 'crash' for name in self.crashed}, **self.errors}
+
+
+class _Worker:
+    def __init__(self, ctx, plugin_name: str, deadline: float):
+        self.conn, child_conn = ctx.Pipe()
+        self.proc = ctx.Process(target=_worker_main, args=(plugin_name, child_conn),
+                                daemon=True)
+        self.proc.start()
+        child_conn.close()
+        self.task: str | None = '<startup>'
+        self.deadline = time.monotonic() + deadline
+
+    def assign(self, name: str, deadline: float):
+        self.task = name
+        self.deadline = time.monotonic() + deadline
+        self.conn.send(name)
+
+    def kill(self):
+        self.proc.kill()
+        self.proc.join()
+        self.conn.close()
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.proc.join(5)
+        if self.proc.is_alive():
+            self.kill()
+
+
+def probe_isolated(plugin_name: str, deadline=DEFAULT_DEADLINE,
+                   n_workers: int | None = None) -> ProbeResult:
+    """Probe the classes of the probe_engine plugin, giving each class
+    `deadline` seconds. The plugin must be built in or loaded from
+    $TK_DEFAULTS_PLUGINS so that the workers can find it too."""
+    from probe_engine import get_plugin
+    plugin = get_plugin(plugin_name)
+    if n_workers is None:
+        n_workers = int(os.getenv('TK_DEFAULTS_WORKERS', DEFAULT_WORKERS))
+    ctx = multiprocessing.get_context('spawn')  # no fork: Tk isn't fork-safe
+    todo = plugin.discover_classes()
+    todo.reverse()  # so pop() gives them in order
+    result = ProbeResult()
+    workers = [_Worker(ctx, plugin_name, deadline) for _ in range(min(n_workers, len(todo)))]
+    startup_failures = 0
+    while workers:
+        ready = wait([w.conn for w in workers], timeout=max(
+            0.0, min(w.deadline for w in workers) - time.monotonic()))
+        for w in list(workers):
+            task = w.task
+            if w.conn in ready:
+                try:
+                    msg = w.conn.recv()
+                except EOFError:
+                    msg = ('crash', None)
+            elif time.monotonic() > w.deadline:
+                msg = ('timeout', None)
+            else:
+                continue
+            kind, data = msg if msg is not None else ('ready', None)
+            if kind == 'setup_failed':  # same in every worker, so give up on the plugin
+                for other in workers:
+                    other.kill()
+                return ProbeResult(skipped=data)
+            if kind in ('crash', 'timeout'):
+                w.kill()
+                workers.remove(w)
+                if task == '<startup>':
+                    startup_failures += 1
+                    print(f'##[warn]WARN: Probe worker failed to start ({kind})')
+                    if startup_failures > n_workers:
+                        raise RuntimeError('Probe workers keep failing to start')
+                else:
+                    print(f'##[warn]WARN: {plugin_name}: class {task!r}: {kind}')
+                    (result.timed_out if kind == 'timeout' else result.crashed).append(task)
+                if todo:
+                    workers.append(_Worker(ctx, plugin_name, deadline))
+                continue
+            if kind == 'ok' and data is not None:
+                result.defaults[plugin.key_prefix + task] = data
+            elif kind == 'error':
+                print(f'##[warn]WARN: {plugin_name}: class {task!r}: {data}')
+                result.errors[task] = data
+            if todo:
+                w.assign(todo.pop(), deadline)
+            else:
+                w.stop()
+                workers.remove(w)
+    return result
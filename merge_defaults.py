@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import os
 import re
-from dataclasses import dataclass
 from pathlib import Path
-from typing import TypeVar, Iterable
+from typing import TYPE_CHECKING, NamedTuple, TypeVar, Iterable
 
-from utils import readfile_json, writefile_json, JsonT
+import shards
+from utils import file_lock, readfile_json, writefile_json_digest, JsonT
+
+if TYPE_CHECKING:
+    from value_index import IndexBuilder
 
 DEFAULTS_DIR = Path("./tkinter_defaults")
 OUT_DIR = Path('./merged_defaults')
@@ -14,27 +18,97 @@ T = TypeVar('T')
 U = TypeVar('U')
 
 
+def snapshot_paths(defaults_dir: Path) -> list[Path]:
+    return [f for f in defaults_dir.iterdir() if f.is_file() and f.suffix == '.json']
+
+
+def read_snapshots(defaults_dir: Path) -> dict[str, dict[str, dict[str, JsonT]]]:
+    return {f.name: readfile_json(f) for f in snapshot_paths(defaults_dir)}
+
+
+def snapshot_platform(filename: str) -> str:
+    """'default0__CPython-3.10_Linux-....json' -> 'CPython-3.10_Linux-...'"""
+    stem = filename[:-len('.json')] if filename.endswith('.json') else filename
+    return stem.split('__', 1)[-1]
+
+
 def _read_defaults():
-    out = {}
-    for f in DEFAULTS_DIR.iterdir():
-        if not f.is_file():
-            continue
-        data = readfile_json(f)
-        out[f.name] = data
-    return out
-
-
-def merge_defaults():
-    OUT_DIR.mkdir(exist_ok=True)
-    merged = merge_data(*_read_defaults().values())
-    print('Writing detailed file')
-    writefile_json(OUT_DIR / 'details.json', merged)
+    return read_snapshots(DEFAULTS_DIR)
+
+
+def merge_defaults(sharded: bool | None = None, external: bool | None = None):
+    merge_into(DEFAULTS_DIR, OUT_DIR, sharded, external)
+
+
+def merge_into(defaults_dir: Path, out_dir: Path, sharded: bool | None = None,
+               external: bool | None = None):
+    """Merge the snapshots in `defaults_dir` and write the results to `out_dir`.
+    The lock for `out_dir` is held from reading the snapshots until the write
+    is done, so a merge can't overwrite the output of one that saw more snapshots."""
+    from value_index import IndexBuilder  # (circular import)
+    out_dir.mkdir(exist_ok=True)
+    with file_lock(out_dir):
+        index = IndexBuilder()
+        merged = merge_dir(defaults_dir, external, index)
+        _write_merged(out_dir, merged, sharded, index.build())
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, '0').strip().lower() in ('1', 'yes', 'true')
+
+
+def merge_dir(defaults_dir: Path, external: bool | None = None,
+              index: IndexBuilder | None = None) -> dict[str, dict[str, JsonT]]:
+    """Merge all the snapshots in `defaults_dir`. If `external` (default:
+    $TK_DEFAULTS_EXTERNAL_MERGE), use the bounded-memory merge_external instead.
+    If `index` is given, the snapshots are also added to it as they're merged."""
+    if external is None:
+        external = _env_flag('TK_DEFAULTS_EXTERNAL_MERGE')
+    if external:
+        from merge_external import merge_files_external  # (circular import)
+        return merge_files_external(snapshot_paths(defaults_dir), index=index)
+    snapshots = read_snapshots(defaults_dir)
+    if index is not None:
+        for filename, data in snapshots.items():
+            index.add_snapshot(filename, data)
+    return merge_data(*snapshots.values())
+
+
+def write_merged(out_dir: Path, merged: dict[str, dict[str, JsonT]],
+                 sharded: bool | None = None, value_index: dict | None = None):
+    """Write details.json, concise.json and concise_2.json to `out_dir`
+    (and value_index.json if given).
+    If `sharded` (default: $TK_DEFAULTS_SHARDED), also write one file per
+    widget under `out_dir/shards/` and generate the monolithic files from those.
+    Holds the lock for `out_dir` so concurrent merges don't interleave."""
+    with file_lock(out_dir):
+        _write_merged(out_dir, merged, sharded, value_index)
+
+
+def _write_merged(out_dir: Path, merged: dict[str, dict[str, JsonT]],
+                  sharded: bool | None, value_index: dict | None):
+    """write_merged() without taking the lock"""
+    if sharded is None:
+        sharded = _env_flag('TK_DEFAULTS_SHARDED')
     concise = summarise_data_1(merged)
-    print('Writing concise file')
-    writefile_json(OUT_DIR / 'concise.json', concise)
     concise_2 = summarize_data_2(merged)
-    print('Writing extra concise file')
-    writefile_json(OUT_DIR / 'concise_2.json', concise_2)
+    if sharded:
+        print('Writing sharded files')
+        n = shards.write_shards(out_dir, {
+            'details': merged, 'concise': concise, 'concise_2': concise_2})
+        print(f'Wrote {n} changed shards')
+        for kind in shards.KINDS:
+            shards.assemble_from_shards(out_dir, kind)
+    else:
+        print('Writing detailed file')
+        writefile_json_digest(out_dir / 'details.json', merged)
+        print('Writing concise file')
+        writefile_json_digest(out_dir / 'concise.json', concise)
+        print('Writing extra concise file')
+        writefile_json_digest(out_dir / 'concise_2.json', concise_2)
+    if value_index is not None:
+        print('Writing value index')
+        writefile_json_digest(out_dir / 'value_index.json', value_index, indent=None)
 
 
 def summarize_data_2(merged_data: dict[str, dict[str, JsonT]]) -> dict[str, dict[str, str]]:
@@ -155,8 +229,7 @@ def _remove_dup_obj_data(data: Iterable[ObjData]) -> list[ObjData]:
     return [*{*data}]
 
 
-@dataclass(frozen=True)
-class ObjData:
+class ObjData(NamedTuple):  # not a dataclass as that imports inspect (slow)
     typ: str
     value: str
 
@@ -0,0 +1,113 @@
+"""Bounded-memory (external) merge for very large snapshot corpora.
+
+Each snapshot is streamed into (widget, option, value) records that are
+spilled to disk as sorted runs once the memory budget is exceeded.
+The runs are then k-way merged and merge_attr() is called on each
+(widget, option) group, so peak memory is set by the budget (plus one
+snapshot and the merged output) instead of by the size of the corpus.
+Each record also has the snapshot's platform so the value index can be
+built from the same pass over the runs."""
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from merge_defaults import merge_attr, snapshot_platform
+from utils import readfile_json, JsonT
+
+if TYPE_CHECKING:
+    from value_index import IndexBuilder
+
+DEFAULT_BUDGET = 64 * 1024 * 1024  # approx. bytes of records held before spilling
+MAX_FAN_IN = 64  # max runs open at once, otherwise do more merge passes
+
+_Record = tuple[str, str, str]  # (widget, option, json line of [widget, option, value, platform])
+
+
+def _budget_from_env() -> int:
+    return int(os.getenv('TK_DEFAULTS_MERGE_BUDGET', DEFAULT_BUDGET))
+
+
+def _record_key(r: _Record) -> tuple[str, str]:
+    return r[0], r[1]
+
+
+def _write_run(records: Iterable[_Record], tmp_dir: Path, n: int) -> Path:
+    path = tmp_dir / f'run{n}.jsonl'
+    with open(path, 'w', encoding='utf8') as f:
+        for _w, _opt, line in records:
+            f.write(line)
+            f.write('\n')
+    return path
+
+
+def _read_run(path: Path) -> Iterator[_Record]:
+    with open(path, encoding='utf8') as f:
+        for line in f:
+            line = line.rstrip('\n')
+            widget, opt, _value, _plat = json.loads(line)
+            yield widget, opt, line
+
+
+def make_runs(paths: Iterable[Path], tmp_dir: Path, budget: int) -> list[Path]:
+    runs = []
+    buf: list[_Record] = []
+    size = 0
+    for path in paths:
+        plat = snapshot_platform(path.name)
+        for widget, options in readfile_json(path).items():
+            for opt, value in options.items():
+                line = json.dumps([widget, opt, value, plat])
+                buf.append((widget, opt, line))
+                size += len(line) + 100  # + rough per-record overhead
+        if size >= budget:
+            buf.sort(key=_record_key)  # stable so snapshot order is kept
+            runs.append(_write_run(buf, tmp_dir, len(runs)))
+            buf, size = [], 0
+    if buf:
+        buf.sort(key=_record_key)
+        runs.append(_write_run(buf, tmp_dir, len(runs)))
+    return runs
+
+
+def _merge_runs(runs: list[Path]) -> Iterator[_Record]:
+    return heapq.merge(*map(_read_run, runs), key=_record_key)
+
+
+def _reduce_fan_in(runs: list[Path], tmp_dir: Path) -> list[Path]:
+    n = len(runs)
+    while len(runs) > MAX_FAN_IN:
+        new_runs = []
+        for i in range(0, len(runs), MAX_FAN_IN):
+            batch = runs[i:i + MAX_FAN_IN]
+            new_runs.append(_write_run(_merge_runs(batch), tmp_dir, n))
+            n += 1
+            for p in batch:
+                p.unlink()
+        runs = new_runs
+    return runs
+
+
+def merge_files_external(paths: Iterable[Path], budget: int | None = None,
+                         tmp_dir: str | os.PathLike | None = None,
+                         index: IndexBuilder | None = None
+                         ) -> dict[str, dict[str, JsonT]]:
+    """Same result as merge_data(*(readfile_json(p) for p in paths)).
+    If `index` is given, the records are also added to it."""
+    if budget is None:
+        budget = _budget_from_env()
+    out: dict[str, dict[str, JsonT]] = {}
+    with tempfile.TemporaryDirectory(prefix='tk_defaults_merge_', dir=tmp_dir) as d:
+        runs = _reduce_fan_in(make_runs(paths, Path(d), budget), Path(d))
+        for (widget, opt), group in itertools.groupby(_merge_runs(runs), key=_record_key):
+            records = [json.loads(line) for _w, _o, line in group]
+            out.setdefault(widget, {})[opt] = merge_attr(*(r[2] for r in records))
+            if index is not None:
+                for _w, _o, value, plat in records:
+                    index.add(plat, widget, opt, value)
+    return out
@@ -0,0 +1,457 @@
+"""Plugin-based probing of several widget modules in one Tk session.
+
+Each ProbePlugin says how to find the classes of one module and how to
+construct them; all registered plugins are probed with the same
+tkinter.Tk() and each writes to its own snapshot tree. Third-party
+plugins call register_plugin() when imported: list their modules in
+$TK_DEFAULTS_PLUGINS (comma-separated) to load them."""
+from __future__ import annotations
+
+import argparse
+import gc
+import importlib
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import tkinter
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from tkinter import TclError
+from types import ModuleType
+from typing import TYPE_CHECKING, Callable, TextIO
+
+import _tkinter as tk_internal
+
+from probe_variants import probe_variants
+
+if TYPE_CHECKING:
+    from isolated_probe import ProbeResult
+
+DEBUG = 1
+
+
+def debug(msg: str, always=False, level=1):
+    if DEBUG >= level or always:
+        print(msg)
+
+
+def short_repr(obj: object, max_len=40) -> str:
+    try:
+        value = repr(obj)
+    except (TypeError, ValueError, NotImplementedError, AttributeError) as e:
+        print(f'Exception ignored in __repr__: {type(e).__qualname__}: {e!s}',
+              file=sys.stderr)
+        return '<Error-in-repr>'
+    if len(value) <= max_len:
+        return value
+    return value[:max_len - 3] + '...'
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, '0').strip().lower() in ('1', 'yes', 'true')
+
+
+# Per-process counters used to name Tcl variables/widgets/images
+TKINTER_COUNTERS = ((tkinter, '_varnum'), (tkinter, '_checkbutton_count'),
+                    (tkinter.Image, '_last_id'))
+
+
+def reset_tkinter_counters():
+    """So the names are the same as in a fresh process"""
+    for obj, name in TKINTER_COUNTERS:
+        if hasattr(obj, name):
+            setattr(obj, name, 0)
+
+
+def reset_session(temp_root: tkinter.Tk | None):
+    """Destroy the widgets of the previous plugin and reset tkinter's naming
+    state, so each plugin's widgets get the same Tk paths as when it's probed
+    on its own (some defaults are derived from them, e.g. the `variable` of a
+    ttk.Checkbutton made after a tkinter.Checkbutton would be `.!checkbutton2`)"""
+    root = temp_root if temp_root is not None else getattr(tkinter, '_default_root', None)
+    if root is not None:
+        for child in list(root.children.values()):
+            child.destroy()
+        root._last_child_ids = None
+    gc.collect()  # so old Variables unset their Tcl variable before the names are reused
+    reset_tkinter_counters()
+
+
+def get_temp_root():
+    if not _env_flag('TK_DEFAULTS_FALLBACK'):
+        return tkinter.Tk()
+    try:
+        return tkinter.Tk()
+    except TclError as e:
+        debug(f'##[warn]WARN: Cannot initialize tkinter.Tk(): {e!s}')
+        print(f'TclError in tkinter.Tk() constructor: {e!s}')
+        # check if stuff works without a tk.Tk() instance
+        tkinter.Button()
+        return None
+
+
+# region discovery strategies
+def all_classes(module: ModuleType) -> list[str]:
+    """Every public class in the module (including ones it imported)"""
+    names = []
+    for name in dir(module):
+        if name.startswith('_'):
+            debug(f'SKIP key {name!r}: private name', level=2)
+            continue
+        if (value := getattr(module, name, None)) is None:
+            debug(f'SKIP key {name!r}: not present or None')
+            continue
+        if not inspect.isclass(value):
+            debug(f'SKIP key {name!r} (type={short_repr(value)}): not a class', level=2)
+            continue
+        names.append(name)
+    return names
+
+
+def own_widgets(module: ModuleType) -> list[str]:
+    """The widget classes defined in the module itself (for modules that
+    re-export tkinter, e.g. `from tkinter import *`)"""
+    return [name for name in all_classes(module)
+            if getattr(module, name).__module__ == module.__name__
+            and issubclass(getattr(module, name), tkinter.Widget)]
+# endregion
+
+
+# region construction strategies
+def construct_inst(name: str, value: type, temp_root: tkinter.Tk | None):
+    try:
+        inst = value(temp_root)
+    except (
+            NotImplementedError, ValueError, TypeError, AttributeError,
+            TclError, RuntimeError) as e:
+        if isinstance(e, (TclError, RuntimeError)):
+            print(f'TclError in 1-arg __init__: _tkinter.TclError: {e!s}',
+                  file=sys.stderr)
+        debug(f'INFO key {name!r}: no 1-arg __init__')
+        try:
+            inst = value()
+        except (NotImplementedError, ValueError, TypeError, AttributeError, RuntimeError):
+            if isinstance(e, (TclError, RuntimeError)):
+                print(f'TclError in 0-arg __init__: _tkinter.TclError: {e!s}',
+                      file=sys.stderr)
+            debug(f'SKIP key {name!r}: no 0-arg or 1-arg __init__')
+            return None
+    return inst
+
+
+def construct_ttk_inst(name: str, value: type, temp_root: tkinter.Tk | None):
+    if name == 'OptionMenu':
+        return _construct_option_menu(value, temp_root)
+    return construct_inst(name, value, temp_root)
+
+
+def _construct_option_menu(value: type, temp_root: tkinter.Tk | None):
+    temp_var = tkinter.Variable(temp_root)
+    try:
+        om = value(temp_root, temp_var)
+    except (NotImplementedError, ValueError, TypeError, AttributeError,
+            TclError, RuntimeError) as e:
+        if isinstance(e, (TclError, RuntimeError)):
+            print(f'Error in 2-arg OptionMenu.__init__: '
+                  f'{type(e).__name__}: {e!s}', file=sys.stderr)
+        debug(f"INFO key 'OptionMenu' (special): no 2-arg __init__(master=root)")
+        try:
+            om = value(None, temp_var)
+        except (NotImplementedError, ValueError, TypeError, AttributeError,
+                TclError, RuntimeError) as e:
+            if isinstance(e, (TclError, RuntimeError)):
+                print(f'Error in 2-arg __init__ (with master=None): '
+                      f'{type(e).__name__}: {e!s}', file=sys.stderr)
+            debug(f"WARN key 'OptionMenu' (special): no 2-arg __init__ at all")
+            return None
+    return om
+# endregion
+
+
+def get_inst_defaults(inst, name: str) -> dict[str, ...] | None:
+    try:
+        # Stringify all the values so that tkinter knows that it needs to
+        # calculate the string value but tkinter doesn't actually return
+        # the string value the first time for some reason so we need
+        # to call it again after it has calculated the string value
+        _ = str(dict(inst))
+        return dict(inst)
+    except (NotImplementedError, TypeError, ValueError, AttributeError):
+        debug(f'INFO key {name!r} (inst={short_repr(inst)}): cannot convert to dict')
+    # try another way
+    try:
+        _ = str(inst.configure())
+        options_list = inst.configure()
+    except (NotImplementedError, TypeError, ValueError, AttributeError):
+        debug(f'SKIP key {name!r} (inst={short_repr(inst)}): '
+              f'cannot configure 0-arg')
+        return None
+    try:
+        return {((tup[0], tup[1]) if tup[0] != tup[1] else tup[0]):
+                tup[4] for tup in options_list}
+    except (NotImplementedError, TypeError, ValueError, AttributeError):
+        debug(f'SKIP key {name!r} ('
+              f'inst={short_repr(inst)}): bad configure() output')
+        return None
+
+
+@dataclass
+class ProbePlugin:
+    name: str
+    module: str  # import path of the module to probe
+    key_prefix: str  # prefix of the keys in the output
+    out_dir: Path  # snapshot tree
+    discover: Callable[[ModuleType], list[str]] = all_classes
+    construct: Callable[[str, type, tkinter.Tk | None], object] = construct_inst
+    # Called with the shared root before probing. Raise TclError (or
+    # ImportError) if the module can't be used in this session.
+    setup: Callable[[tkinter.Tk | None], None] | None = None
+
+    def load_module(self) -> ModuleType:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', DeprecationWarning)  # tkinter.tix
+            return importlib.import_module(self.module)
+
+    def discover_classes(self) -> list[str]:
+        return self.discover(self.load_module())
+
+    def probe_class(self, name: str, temp_root: tkinter.Tk | None) -> dict[str, ...] | None:
+        value = getattr(self.load_module(), name)
+        if (inst := self.construct(name, value, temp_root)) is None:
+            return None
+        if (defaults := get_inst_defaults(inst, name)) is None:
+            return None
+        debug(f'Success key {name!r} (type={short_repr(value)}, '
+              f'inst={short_repr(inst)}): defaults={short_repr(defaults, 40)}')
+        return defaults
+
+
+PLUGINS: dict[str, ProbePlugin] = {}
+
+
+def register_plugin(plugin: ProbePlugin, replace=False):
+    if plugin.name in PLUGINS and not replace:
+        raise ValueError(f'Probe plugin {plugin.name!r} is already registered')
+    PLUGINS[plugin.name] = plugin
+
+
+def _require_tix(temp_root: tkinter.Tk | None):
+    if temp_root is None:
+        raise TclError('tix needs a Tk root')
+    temp_root.tk.eval('package require Tix')
+
+
+def _module_exists(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ImportError:
+        return False
+
+
+register_plugin(ProbePlugin('tkinter', 'tkinter', '', Path('./tkinter_defaults')))
+register_plugin(ProbePlugin('ttk', 'tkinter.ttk', 'ttk.', Path('./ttk_defaults'),
+                            construct=construct_ttk_inst))
+register_plugin(ProbePlugin('scrolledtext', 'tkinter.scrolledtext', 'scrolledtext.',
+                            Path('./scrolledtext_defaults'), discover=own_widgets))
+if _module_exists('tkinter.tix'):  # removed in 3.13
+    register_plugin(ProbePlugin('tix', 'tkinter.tix', 'tix.', Path('./tix_defaults'),
+                                discover=own_widgets, setup=_require_tix))
+_loaded_env_plugins = False
+
+
+def load_plugins() -> dict[str, ProbePlugin]:
+    """Import the modules in $TK_DEFAULTS_PLUGINS (so they register their
+    plugins) and return all the registered plugins"""
+    global _loaded_env_plugins
+    if not _loaded_env_plugins:
+        _loaded_env_plugins = True
+        for mod in os.getenv('TK_DEFAULTS_PLUGINS', '').split(','):
+            if mod.strip():
+                importlib.import_module(mod.strip())
+    return PLUGINS
+
+
+def get_plugin(name: str) -> ProbePlugin:
+    return load_plugins()[name]
+
+
+def probe_plugin(plugin: ProbePlugin, temp_root: tkinter.Tk | None,
+                 variants=False) -> dict[str, dict]:
+    out = {}
+    classes = {}
+    module = plugin.load_module()
+    for name in plugin.discover(module):
+        if (defaults := plugin.probe_class(name, temp_root)) is None:
+            continue
+        out[plugin.key_prefix + name] = defaults
+        classes[plugin.key_prefix + name] = getattr(module, name)
+    if variants:
+        out.update(probe_variants(classes, temp_root, get_inst_defaults))
+    return out
+
+
+class IncompleteProbeError(Exception):
+    """Some classes timed out, crashed or raised in an isolated probe.
+    `results` has the ProbeResult of every plugin so the partial defaults
+    can be kept without being mistaken for a complete snapshot."""
+
+    def __init__(self, results: dict[str, ProbeResult]):
+        self.results = results
+        failures = {name: r.failures for name, r in results.items() if r.failures}
+        super().__init__(f'Incomplete probe: {failures}')
+
+
+def probe_all(names: list[str] | None = None, variants: bool | None = None,
+              isolated: bool | None = None) -> dict[str, dict[str, dict]]:
+    """Probe the plugins called `names` (default: all registered) in one Tk
+    session and return {plugin name: defaults}.
+    If `variants` (default: $TK_DEFAULTS_VARIANTS), also probe the
+    constructor-option variants in probe_variants.VARIANTS.
+    If `isolated` (default: $TK_DEFAULTS_ISOLATED), probe each class in
+    worker processes with a deadline instead (see isolated_probe); this
+    ignores `variants` (with a warning) and raises IncompleteProbeError if
+    any class couldn't be probed."""
+    plugins = load_plugins()
+    names = list(plugins) if names is None else names
+    if variants is None:
+        variants = _env_flag('TK_DEFAULTS_VARIANTS')
+    if isolated is None:
+        isolated = _env_flag('TK_DEFAULTS_ISOLATED')
+    if isolated:
+        from isolated_probe import probe_isolated
+        if variants:
+            debug("##[warn]WARN: Variants aren't probed in isolated mode, "
+                  "ignoring variants=True / $TK_DEFAULTS_VARIANTS", always=True)
+        results = {}
+        for name in names:
+            if (result := probe_isolated(name)).skipped is not None:
+                debug(f'##[warn]WARN: Skipping plugin {name!r}: {result.skipped}')
+                continue
+            results[name] = result
+        if any(r.failures for r in results.values()):
+            raise IncompleteProbeError(results)
+        return {name: r.defaults for name, r in results.items()}
+    out = {}
+    temp_root = get_temp_root()
+    for name in names:
+        plugin = plugins[name]
+        reset_session(temp_root)
+        if plugin.setup is not None:
+            try:
+                plugin.setup(temp_root)
+            except (TclError, ImportError) as e:
+                debug(f'##[warn]WARN: Skipping plugin {name!r}: {type(e).__name__}: {e!s}')
+                continue
+        debug(f'INFO: Probing plugin {name!r} ({plugin.module})')
+        out[name] = probe_plugin(plugin, temp_root, variants)
+    if temp_root is not None:
+        temp_root.destroy()
+    return out
+
+
+ALLOWED_JSON_TYPES = (int, float, str, dict, list, tuple, bool, type(None))
+
+
+class ReplayTclObj:
+    """Stand-in for a _tkinter.Tcl_Obj in a replayed answer (see tk_trace)"""
+    __slots__ = ('typename', 'string')
+
+    def __init__(self, typename: str, string: str):
+        self.typename = typename
+        self.string = string
+
+    def __str__(self):
+        return self.string
+
+    def __repr__(self):
+        return f'<{self.typename} object: {self.string!r}>'
+
+
+def make_value_serializable(v: object):
+    if isinstance(v, ALLOWED_JSON_TYPES):
+        return v
+    if isinstance(v, (tk_internal.Tcl_Obj, ReplayTclObj)):
+        return f'@Tcl_Obj: type={v.typename}, value={v.string}'
+    return f'@repr:{repr(v)}'
+
+
+class TclSafeEncoder(json.JSONEncoder):
+    def default(self, o: object):
+        return make_value_serializable(o)
+
+
+def transform_to_serializable(defaults_o: dict[str, dict]):
+    def tform_one(o: dict[str, object]) -> dict[str, object]:
+        return {key: make_value_serializable(value) for key, value in o.items()}
+
+    return {key: tform_one(value) for key, value in defaults_o.items()}
+
+
+def dumps_defaults(defaults: dict[str, dict]) -> str:
+    return json.dumps(transform_to_serializable(defaults), indent=4,
+                      sort_keys=True, cls=TclSafeEncoder)
+
+
+def dump_defaults(file: TextIO, defaults: dict[str, dict]):
+    json.dump(transform_to_serializable(defaults), file, indent=4,
+              sort_keys=True, cls=TclSafeEncoder)
+
+
+def defaults_str(results: dict[str, dict[str, dict]] | None = None) -> str:
+    """JSON of {plugin name: defaults} (used by tk_trace)"""
+    if results is None:
+        results = probe_all()
+    return json.dumps({name: transform_to_serializable(d) for name, d in results.items()},
+                      indent=4, sort_keys=True, cls=TclSafeEncoder)
+
+
+def write_snapshots(results: dict[str, dict[str, dict]], check_overwrite=True):
+    """Write each plugin's defaults to a new snapshot in its tree
+    (unless an identical one is already there)"""
+    from write_curr_defaults import write_snapshot  # (circular import)
+    for name, defaults in results.items():
+        plugin = PLUGINS[name]
+        plugin.out_dir.mkdir(exist_ok=True)
+        res_path = write_snapshot(plugin.out_dir, dumps_defaults(defaults), check_overwrite)
+        debug(f'INFO: {name} defaults are in {res_path}')
+
+
+def write_incomplete_snapshots(results: dict[str, ProbeResult], check_overwrite=True):
+    """Write the plugins that were probed completely as normal snapshots and
+    the rest to their `incomplete/` dir (see write_incomplete_snapshot)"""
+    from write_curr_defaults import write_incomplete_snapshot  # (circular import)
+    write_snapshots({name: r.defaults for name, r in results.items() if not r.failures},
+                    check_overwrite)
+    for name, result in results.items():
+        if result.failures:
+            res_path = write_incomplete_snapshot(PLUGINS[name].out_dir, result)
+            debug(f'##[warn]WARN: {name} probe was incomplete, '
+                  f'partial defaults are in {res_path}', always=True)
+
+
+def run(names: list[str] | None = None, variants: bool | None = None,
+        isolated: bool | None = None, check_overwrite=True):
+    """probe_all() and write the snapshots. Raises IncompleteProbeError (after
+    writing what was probed) if the probe was incomplete."""
+    try:
+        results = probe_all(names, variants, isolated)
+    except IncompleteProbeError as e:
+        write_incomplete_snapshots(e.results, check_overwrite)
+        raise
+    write_snapshots(results, check_overwrite)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('plugins', nargs='*', help='default: all registered plugins')
+    parser.add_argument('--variants', action='store_true', default=None)
+    parser.add_argument('--isolated', action='store_true', default=None)
+    args = parser.parse_args()
+    run(args.plugins or None, args.variants, args.isolated)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Defaults that depend on constructor options (e.g. `orient`, `state`).
+
+Each (class, variant kwargs) combination is recorded as an extra widget
+key like 'Scale[orient=horizontal]' so the merge treats it like any other
+widget. Widgets are built in batches in the existing Tk session and
+destroyed after each batch to keep the interpreter's memory flat."""
+from __future__ import annotations
+
+import sys
+from typing import Callable
+
+# output key -> kwargs of each variant to probe
+VARIANTS: dict[str, tuple[dict[str, str], ...]] = {
+    'Scale': ({'orient': 'horizontal'}, {'orient': 'vertical'}),
+    'Scrollbar': ({'orient': 'horizontal'}, {'orient': 'vertical'}),
+    'PanedWindow': ({'orient': 'horizontal'}, {'orient': 'vertical'}),
+    'Entry': ({'state': 'disabled'}, {'state': 'readonly'}),
+    'Spinbox': ({'state': 'disabled'}, {'state': 'readonly'}),
+    'ttk.Progressbar': ({'mode': 'determinate'}, {'mode': 'indeterminate'},
+                        {'orient': 'horizontal'}, {'orient': 'vertical'}),
+    'ttk.Scale': ({'orient': 'horizontal'}, {'orient': 'vertical'}),
+    'ttk.Scrollbar': ({'orient': 'horizontal'}, {'orient': 'vertical'}),
+    'ttk.Separator': ({'orient': 'horizontal'}, {'orient': 'vertical'}),
+    'ttk.Panedwindow': ({'orient': 'horizontal'}, {'orient': 'vertical'}),
+    'ttk.Entry': ({'state': 'disabled'}, {'state': 'readonly'}),
+    'ttk.Combobox': ({'state': 'disabled'}, {'state': 'readonly'}),
+}
+BATCH_SIZE = 16
+
+
+def variant_key(name: str, kwargs: dict[str, str]) -> str:
+    return f'{name}[{",".join(f"{k}={v}" for k, v in sorted(kwargs.items()))}]'
+
+
+def is_variant_key(key: str) -> bool:
+    return key.endswith(']')
+
+
+def probe_variants(classes: dict[str, type], temp_root,
+                   get_inst_defaults: Callable[[object, str], dict | None],
+                   batch_size=BATCH_SIZE) -> dict[str, dict]:
+    """Return {variant_key: defaults} for the VARIANTS of the given
+    {output key: class} that could be constructed."""
+    from tkinter import TclError  # (so is_variant_key doesn't import tkinter)
+    todo = [(variant_key(name, kw), classes[name], kw)
+            for name, variants in VARIANTS.items() if name in classes
+            for kw in variants]
+    out = {}
+    for i in range(0, len(todo), batch_size):
+        insts = []
+        for key, cls, kwargs in todo[i:i + batch_size]:
+            try:
+                insts.append((key, cls(temp_root, **kwargs)))
+            except (NotImplementedError, ValueError, TypeError, AttributeError,
+                    TclError, RuntimeError) as e:
+                print(f'Error constructing variant {key}: {type(e).__name__}: {e!s}',
+                      file=sys.stderr)
+        for key, inst in insts:
+            if (defaults := get_inst_defaults(inst, key)) is not None:
+                out[key] = defaults
+        for _key, inst in insts:
+            inst.destroy()
+    return out
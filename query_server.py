@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from merge_defaults import merge_widget, read_snapshots, snapshot_platform
+from utils import readfile_json, JsonT
+
+MERGED_FILES = (Path('./merged_defaults/details.json'),
+                Path('./ttk_merged_defaults/details.json'))
+SNAPSHOT_DIRS = (Path('./tkinter_defaults'), Path('./ttk_defaults'))
+
+RELOAD_CHECK_INTERVAL = 0.5  # seconds between stat() calls for hot-reload
+
+
+def _body_bytes(data: JsonT) -> bytes:
+    return json.dumps(data, sort_keys=True, separators=(',', ':')).encode('utf8')
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+class _State:
+    """Everything loaded by one reload. reload() swaps in a new state in one
+    assignment, so a request that started before it only ever reads (and
+    caches into) the old one."""
+    __slots__ = ('generation', 'widgets', 'snapshots', 'responses')
+
+    def __init__(self, generation: int, widgets: dict[str, dict[str, JsonT]]):
+        self.generation = generation
+        self.widgets = widgets
+        self.snapshots: list[tuple[str, dict[str, dict[str, JsonT]]]] | None = None
+        self.responses: dict[tuple, tuple[str, bytes]] = {}
+
+
+class DefaultsIndex:
+    """The merged tkinter and ttk defaults, loaded once and kept in memory.
+    Platform-filtered queries re-merge only the snapshots of that platform
+    (and only the requested widget) and are cached until the next reload."""
+
+    def __init__(self, merged_files=MERGED_FILES, snapshot_dirs=SNAPSHOT_DIRS):
+        self.merged_files = tuple(merged_files)
+        self.snapshot_dirs = tuple(snapshot_dirs)
+        self._lock = threading.Lock()
+        self._stamp = None
+        self._last_check = 0.0
+        self._state = _State(0, {})
+        self.reload()
+
+    @property
+    def generation(self) -> int:
+        return self._state.generation
+
+    @property
+    def widgets(self) -> dict[str, dict[str, JsonT]]:
+        return self._state.widgets
+
+    def _get_stamp(self):
+        return tuple(p.stat().st_mtime_ns if p.exists() else None
+                     for p in self.merged_files)
+
+    def reload(self):
+        with self._lock:
+            stamp = self._get_stamp()
+            widgets = {}
+            for path in self.merged_files:
+                if path.exists():
+                    widgets.update(readfile_json(path))
+            # snapshots are loaded lazily, only for platform queries
+            self._state = _State(self._state.generation + 1, widgets)
+            self._stamp = stamp
+
+    def maybe_reload(self) -> bool:
+        """Reload if the merge has written new outputs. Returns True if reloaded"""
+        now = time.monotonic()
+        if now - self._last_check < RELOAD_CHECK_INTERVAL:
+            return False
+        self._last_check = now
+        if self._get_stamp() == self._stamp:
+            return False
+        self.reload()
+        return True
+
+    def _get_snapshots(self, state: _State):
+        if state.snapshots is None:
+            # tkinter_defaults/ and ttk_defaults/ use the same filenames
+            state.snapshots = [item for d in self.snapshot_dirs if d.exists()
+                               for item in read_snapshots(d).items()]
+        return state.snapshots
+
+    def platforms(self, state: _State | None = None) -> list[str]:
+        state = self._state if state is None else state
+        return sorted({snapshot_platform(name) for name, _ in self._get_snapshots(state)})
+
+    def widget(self, name: str, platform: str | None = None,
+               state: _State | None = None) -> dict[str, JsonT] | None:
+        state = self._state if state is None else state
+        if platform is None:
+            return state.widgets.get(name)
+        platform = platform.lower()
+        data_ls = [data[name] for fname, data in self._get_snapshots(state)
+                   if platform in snapshot_platform(fname).lower() and name in data]
+        if not data_ls:
+            return None
+        return merge_widget(*data_ls)
+
+    def response(self, key: tuple) -> tuple[int, str | None, bytes]:
+        """Return (status, etag, body) for a parsed request key"""
+        state = self._state  # read once: a reload mid-request mustn't mix states
+        if (cached := state.responses.get(key)) is not None:
+            return HTTPStatus.OK, *cached
+        found, data = self._lookup(state, *key)
+        if not found:
+            return HTTPStatus.NOT_FOUND, None, _body_bytes({'error': data})
+        body = _body_bytes(data)
+        etag = _etag(body)
+        state.responses[key] = (etag, body)
+        return HTTPStatus.OK, etag, body
+
+    def _lookup(self, state: _State, route: str, widget: str | None, option: str | None,
+                platform: str | None) -> tuple[bool, JsonT]:
+        if route == 'widgets':
+            return True, sorted(state.widgets)
+        if route == 'platforms':
+            return True, self.platforms(state)
+        if (w_data := self.widget(widget, platform, state)) is None:
+            return False, f'No such widget: {widget!r}'
+        if option is None:
+            return True, w_data
+        if option not in w_data:
+            return False, f'No such option: {widget!r}.{option!r}'
+        return True, w_data[option]
+
+
+def parse_request_path(path: str) -> tuple | None:
+    """Return a (route, widget, option, platform) key or None if not a valid route"""
+    parts = urlsplit(path)
+    platform = parse_qs(parts.query).get('platform', [None])[-1]
+    segments = [unquote(s) for s in parts.path.split('/') if s]
+    if segments in (['widgets'], ['platforms']):
+        return segments[0], None, None, None
+    if len(segments) in (2, 3) and segments[0] == 'widget':
+        option = segments[2] if len(segments) == 3 else None
+        return 'widget', segments[1], option, platform
+    return None
+
+
+class DefaultsRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    disable_nagle_algorithm = True
+    index: DefaultsIndex  # set on the subclass by make_server()
+    quiet = False
+
+    def do_GET(self):
+        self.index.maybe_reload()
+        if (key := parse_request_path(self.path)) is None:
+            return self._send(HTTPStatus.NOT_FOUND, None, _body_bytes({'error': 'Unknown route'}))
+        status, etag, body = self.index.response(key)
+        if etag is not None and self.headers.get('If-None-Match') == etag:
+            return self._send(HTTPStatus.NOT_MODIFIED, etag, b'')
+        self._send(status, etag, body)
+
+    def _send(self, status: int, etag: str | None, body: bytes):
+        self.send_response(status)
+        if etag is not None:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+def make_server(host='127.0.0.1', port=8765, index: DefaultsIndex | None = None,
+                quiet=False) -> ThreadingHTTPServer:
+    handler = type('_Handler', (DefaultsRequestHandler,), {
+        'index': index if index is not None else DefaultsIndex(),
+        'quiet': quiet})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve the merged defaults over HTTP')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+    server = make_server(args.host, args.port)
+    print(f'Serving merged defaults on http://{args.host}:{server.server_port}/')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
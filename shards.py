@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable
+
+from utils import digest_path, readfile_json, writefile_json_digest, json_digest, JsonT, DIGEST_SUFFIX
+
+SHARDS_DIRNAME = 'shards'
+MANIFEST_NAME = 'manifest.json'
+KINDS = ('details', 'concise', 'concise_2')
+
+
+def shards_dir(out_dir: Path) -> Path:
+    return out_dir / SHARDS_DIRNAME
+
+
+def _shard_name(widget: str) -> str:
+    """Filenames are case-insensitive on macOS and Windows and e.g. both
+    ttk.LabelFrame and ttk.Labelframe exist, so each uppercase letter is
+    marked: 'ttk.LabelFrame' -> 'ttk.^label^frame' (and '^' -> '^^')"""
+    return ''.join('^^' if c == '^' else f'^{c.lower()}' if c.isupper() else c
+                   for c in widget)
+
+
+def shard_path(out_dir: Path, kind: str, widget: str) -> Path:
+    return shards_dir(out_dir) / kind / f'{_shard_name(widget)}.json'
+
+
+def read_manifest(out_dir: Path) -> dict[str, dict[str, str]]:
+    """Return {kind: {widget: digest}} (empty if there are no shards yet)"""
+    path = shards_dir(out_dir) / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    return readfile_json(path)['kinds']
+
+
+def write_shards(out_dir: Path, outputs: dict[str, dict[str, JsonT]]) -> int:
+    """Write one file per widget for each kind in `outputs`, only touching
+    the shards whose content changed. Returns the number of shards written."""
+    old_manifest = read_manifest(out_dir)
+    new_manifest = {}
+    n_written = 0
+    for kind, data in outputs.items():
+        (shards_dir(out_dir) / kind).mkdir(parents=True, exist_ok=True)
+        old_digests = old_manifest.get(kind, {})
+        new_digests = new_manifest[kind] = {}
+        for widget, content in data.items():
+            digest = new_digests[widget] = json_digest(content)
+            path = shard_path(out_dir, kind, widget)
+            if (old_digests.get(widget) == digest and path.exists()
+                    and digest_path(path).exists()):
+                continue
+            writefile_json_digest(path, content)
+            n_written += 1
+        # remove the shards of widgets that are gone (and any old-style names)
+        expected = {shard_path(out_dir, kind, w).name for w in new_digests}
+        for path in (shards_dir(out_dir) / kind).iterdir():
+            if path.name.removesuffix(DIGEST_SUFFIX) not in expected:
+                path.unlink()
+    writefile_json_digest(shards_dir(out_dir) / MANIFEST_NAME,
+                   {'version': 1, 'kinds': new_manifest})
+    return n_written
+
+
+def read_shards(out_dir: Path, kind: str,
+                widgets: Iterable[str] | None = None) -> dict[str, JsonT]:
+    """Read only the requested widgets (or all of them if `widgets` is None)"""
+    if widgets is None:
+        widgets = read_manifest(out_dir).get(kind, {}).keys()
+    return {w: readfile_json(shard_path(out_dir, kind, w)) for w in widgets}
+
+
+def assemble_from_shards(out_dir: Path, kind: str):
+    """Regenerate the monolithic {kind}.json file from the shards"""
+    writefile_json_digest(out_dir / f'{kind}.json', read_shards(out_dir, kind))
@@ -0,0 +1,621 @@
+# Default option values for typeshed's tkinter/__init__.pyi
+# Generated by gen_stub_defaults.py from the merged defaults
+
+class Button:
+    activebackground = ...  # @different:3
+    activeforeground = ...  # @different:3
+    anchor = "center"
+    background = ...  # @different:3
+    bd = ...  # @different:3
+    bg = ...  # @different:3
+    bitmap = ""
+    borderwidth = ...  # @different:3
+    command = ""
+    compound = "none"
+    cursor = ""
+    default = "disabled"
+    disabledforeground = ...  # @different:2
+    fg = ...  # @different:3
+    font = "TkDefaultFont"
+    foreground = ...  # @different:3
+    height = 0
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = 1  # @typeDiff:2
+    image = ""
+    justify = "center"
+    overrelief = ""
+    padx = ...  # @different:3
+    pady = ...  # @different:3
+    relief = ...  # @different:2
+    repeatdelay = 0
+    repeatinterval = 0
+    state = "normal"
+    takefocus = ""
+    text = ""
+    textvariable = ""
+    underline = -1
+    width = 0
+    wraplength = 0  # @typeDiff:2
+
+
+class Canvas:
+    background = ...  # @different:3
+    bd = 0
+    bg = ...  # @different:3
+    borderwidth = 0
+    closeenough = "1.0"
+    confine = 1
+    cursor = ""
+    height = ...  # @different:4
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = ...  # @different:3
+    insertbackground = ...  # @different:3
+    insertborderwidth = 0
+    insertofftime = 300
+    insertontime = 600
+    insertwidth = 2
+    offset = "0,0"
+    relief = "flat"
+    scrollregion = ""
+    selectbackground = ...  # @different:3
+    selectborderwidth = 1
+    selectforeground = ...  # @different:3
+    state = "normal"
+    takefocus = ""
+    width = ...  # @different:4
+    xscrollcommand = ""
+    xscrollincrement = 0
+    yscrollcommand = ""
+    yscrollincrement = 0
+
+
+class Checkbutton:
+    activebackground = ...  # @different:3
+    activeforeground = ...  # @different:3
+    anchor = "center"
+    background = ...  # @different:3
+    bd = ...  # @different:3
+    bg = ...  # @different:3
+    bitmap = ""
+    borderwidth = ...  # @different:3
+    command = ""
+    compound = "none"
+    cursor = ""
+    disabledforeground = ...  # @different:2
+    fg = ...  # @different:3
+    font = "TkDefaultFont"
+    foreground = ...  # @different:3
+    height = 0
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = 1  # @typeDiff:2
+    image = ""
+    indicatoron = 1
+    justify = "center"
+    offrelief = ...  # @different:2
+    offvalue = 0
+    onvalue = 1
+    overrelief = ""
+    padx = 1  # @typeDiff:2
+    pady = 1  # @typeDiff:2
+    relief = "flat"
+    selectcolor = ...  # @different:3
+    selectimage = ""
+    state = "normal"
+    takefocus = ""
+    text = ""
+    textvariable = ""
+    tristateimage = ""
+    tristatevalue = ""
+    underline = -1
+    variable = ...  # @different:4
+    width = 0
+    wraplength = 0  # @typeDiff:2
+
+
+class Entry:
+    background = ...  # @different:3
+    bd = ...  # @different:2
+    bg = ...  # @different:3
+    borderwidth = ...  # @different:2
+    cursor = "xterm"
+    disabledbackground = ...  # @different:3
+    disabledforeground = ...  # @different:2
+    exportselection = 1
+    fg = ...  # @different:3
+    font = "TkTextFont"
+    foreground = ...  # @different:3
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = ...  # @different:3
+    insertbackground = ...  # @different:3
+    insertborderwidth = 0
+    insertofftime = 300
+    insertontime = 600
+    insertwidth = ...  # @different:2
+    invalidcommand = ""
+    invcmd = ""
+    justify = "left"
+    readonlybackground = ...  # @different:3
+    relief = "sunken"
+    selectbackground = ...  # @different:3
+    selectborderwidth = ...  # @different:2
+    selectforeground = ...  # @different:3
+    show = ""
+    state = "normal"
+    takefocus = ""
+    textvariable = ""
+    validate = "none"
+    validatecommand = ""
+    vcmd = ""
+    width = 20
+    xscrollcommand = ""
+
+
+class Frame:
+    background = ...  # @different:3
+    bd = 0
+    bg = ...  # @different:3
+    borderwidth = 0
+    class_ = "Frame"
+    colormap = ""
+    container = 0
+    cursor = ""
+    height = 0
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = 0
+    padx = 0  # @typeDiff:2
+    pady = 0  # @typeDiff:2
+    relief = "flat"
+    takefocus = 0
+    visual = ""
+    width = 0
+
+
+class Label:
+    activebackground = ...  # @different:3
+    activeforeground = ...  # @different:3
+    anchor = "center"
+    background = ...  # @different:3
+    bd = ...  # @different:3
+    bg = ...  # @different:3
+    bitmap = ""
+    borderwidth = ...  # @different:3
+    compound = "none"
+    cursor = ""
+    disabledforeground = ...  # @different:2
+    fg = ...  # @different:3
+    font = "TkDefaultFont"
+    foreground = ...  # @different:3
+    height = 0
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = 0  # @typeDiff:2
+    image = ""
+    justify = "center"
+    padx = 1  # @typeDiff:2
+    pady = 1  # @typeDiff:2
+    relief = "flat"
+    state = "normal"
+    takefocus = 0
+    text = ""
+    textvariable = ""
+    underline = -1
+    width = 0
+    wraplength = 0  # @typeDiff:2
+
+
+class LabelFrame:
+    background = ...  # @different:3
+    bd = 2
+    bg = ...  # @different:3
+    borderwidth = 2
+    class_ = "Labelframe"
+    colormap = ""
+    container = 0
+    cursor = ""
+    fg = ...  # @different:3
+    font = "TkDefaultFont"
+    foreground = ...  # @different:3
+    height = 0
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = 0
+    labelanchor = "nw"
+    labelwidget = ""
+    padx = 0  # @typeDiff:2
+    pady = 0  # @typeDiff:2
+    relief = "groove"
+    takefocus = 0
+    text = ""
+    visual = ""
+    width = 0
+
+
+class Listbox:
+    activestyle = ...  # @different:2
+    background = ...  # @different:3
+    bd = 1
+    bg = ...  # @different:3
+    borderwidth = 1
+    cursor = ""
+    disabledforeground = ...  # @different:2
+    exportselection = 1
+    fg = ...  # @different:3
+    font = ...  # @different:2
+    foreground = ...  # @different:3
+    height = 10
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = ...  # @different:2
+    justify = "left"
+    listvariable = ""
+    relief = ...  # @different:2
+    selectbackground = ...  # @different:3
+    selectborderwidth = 0
+    selectforeground = ...  # @different:3
+    selectmode = "browse"
+    setgrid = 0
+    state = "normal"
+    takefocus = ""
+    width = 20
+    xscrollcommand = ""
+    yscrollcommand = ""
+
+
+class Menu:
+    activebackground = ...  # @different:3
+    activeborderwidth = ...  # @different:3
+    activeforeground = ...  # @different:3
+    background = ...  # @different:3
+    bd = ...  # @different:3
+    bg = ...  # @different:3
+    borderwidth = ...  # @different:3
+    cursor = "arrow"  # @typeDiff:2
+    disabledforeground = ...  # @different:3
+    fg = ...  # @different:3
+    font = ...  # @different:3
+    foreground = ...  # @different:3
+    postcommand = ""
+    relief = ...  # @different:3
+    selectcolor = ...  # @different:3
+    takefocus = 0
+    tearoff = ...  # @different:2
+    tearoffcommand = ""
+    title = ""
+    type = "normal"  # @typeDiff:2
+
+
+class Menubutton:
+    activebackground = ...  # @different:3
+    activeforeground = ...  # @different:3
+    anchor = ...  # @different:2
+    background = ...  # @different:3
+    bd = ...  # @different:2
+    bg = ...  # @different:3
+    bitmap = ""
+    borderwidth = ...  # @different:2
+    compound = "none"
+    cursor = ""
+    direction = "below"
+    disabledforeground = ...  # @different:2
+    fg = ...  # @different:3
+    font = "TkDefaultFont"
+    foreground = ...  # @different:3
+    height = 0
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = 0
+    image = ""
+    indicatoron = ...  # @different:2
+    justify = ...  # @different:2
+    menu = ""
+    padx = ...  # @different:3
+    pady = ...  # @different:2
+    relief = "flat"
+    state = "normal"
+    takefocus = 0
+    text = ""
+    textvariable = ""
+    underline = -1
+    width = 0
+    wraplength = 0
+
+
+class Message:
+    anchor = "center"
+    aspect = 150
+    background = ...  # @different:3
+    bd = 1
+    bg = ...  # @different:3
+    borderwidth = 1
+    cursor = ""
+    fg = ...  # @different:3
+    font = "TkDefaultFont"
+    foreground = ...  # @different:3
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = 0
+    justify = "left"
+    padx = -1  # @typeDiff:2
+    pady = -1  # @typeDiff:2
+    relief = "flat"
+    takefocus = 0
+    text = ""
+    textvariable = ""
+    width = 0
+
+
+class PanedWindow:
+    background = ...  # @different:3
+    bd = 1
+    bg = ...  # @different:3
+    borderwidth = 1
+    cursor = ""
+    handlepad = 8
+    handlesize = 8  # @typeDiff:2
+    height = ""
+    opaqueresize = 1
+    orient = "horizontal"
+    proxybackground = ""
+    proxyborderwidth = 2  # @typeDiff:2
+    proxyrelief = "flat"
+    relief = "flat"
+    sashcursor = ""
+    sashpad = 0
+    sashrelief = "flat"
+    sashwidth = 3  # @typeDiff:2
+    showhandle = 0
+    width = ""
+
+
+class Radiobutton:
+    activebackground = ...  # @different:3
+    activeforeground = ...  # @different:3
+    anchor = "center"
+    background = ...  # @different:3
+    bd = ...  # @different:3
+    bg = ...  # @different:3
+    bitmap = ""
+    borderwidth = ...  # @different:3
+    command = ""
+    compound = "none"
+    cursor = ""
+    disabledforeground = ...  # @different:2
+    fg = ...  # @different:3
+    font = "TkDefaultFont"
+    foreground = ...  # @different:3
+    height = 0
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = 1  # @typeDiff:2
+    image = ""
+    indicatoron = 1
+    justify = "center"
+    offrelief = ...  # @different:2
+    overrelief = ""
+    padx = 1  # @typeDiff:2
+    pady = 1  # @typeDiff:2
+    relief = "flat"
+    selectcolor = ...  # @different:3
+    selectimage = ""
+    state = "normal"
+    takefocus = ""
+    text = ""
+    textvariable = ""
+    tristateimage = ""
+    tristatevalue = ""
+    underline = -1
+    value = ""
+    variable = "selectedButton"  # @typeDiff:2
+    width = 0
+    wraplength = 0  # @typeDiff:2
+
+
+class Scale:
+    activebackground = ...  # @different:3
+    background = ...  # @different:3
+    bd = 1
+    bg = ...  # @different:3
+    bigincrement = 0.0
+    borderwidth = 1
+    command = ""
+    cursor = ""
+    digits = 0
+    fg = ...  # @different:3
+    font = "TkDefaultFont"
+    foreground = ...  # @different:3
+    from_ = 0.0
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = ...  # @different:3
+    label = ""
+    length = 100
+    orient = "vertical"
+    relief = "flat"
+    repeatdelay = 300
+    repeatinterval = 100
+    resolution = 1.0
+    showvalue = 1
+    sliderlength = 30
+    sliderrelief = "raised"
+    state = "normal"
+    takefocus = ""
+    tickinterval = 0.0
+    to = 100.0
+    troughcolor = ...  # @different:3
+    variable = ""
+    width = 15
+
+
+class Scrollbar:
+    activebackground = ...  # @different:3
+    activerelief = "raised"
+    background = ...  # @different:3
+    bd = ...  # @different:2
+    bg = ...  # @different:3
+    borderwidth = ...  # @different:2
+    command = ""
+    cursor = ""
+    elementborderwidth = -1
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = 0
+    jump = 0
+    orient = "vertical"
+    relief = ...  # @different:2
+    repeatdelay = 300
+    repeatinterval = 100
+    takefocus = ""
+    troughcolor = ...  # @different:3
+    width = ...  # @different:3
+
+
+class Spinbox:
+    activebackground = ...  # @different:3
+    background = ...  # @different:3
+    bd = ...  # @different:2
+    bg = ...  # @different:3
+    borderwidth = ...  # @different:2
+    buttonbackground = ...  # @different:3
+    buttoncursor = ""
+    buttondownrelief = ...  # @different:2
+    buttonuprelief = ...  # @different:2
+    command = ""
+    cursor = "xterm"
+    disabledbackground = ...  # @different:3
+    disabledforeground = ...  # @different:2
+    exportselection = 1
+    fg = ...  # @different:3
+    font = "TkTextFont"
+    foreground = ...  # @different:3
+    format = ""
+    from_ = 0.0
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = ...  # @different:3
+    increment = 1.0
+    insertbackground = ...  # @different:3
+    insertborderwidth = 0
+    insertofftime = 300
+    insertontime = 600
+    insertwidth = ...  # @different:2
+    invalidcommand = ""
+    invcmd = ""
+    justify = "left"
+    readonlybackground = ...  # @different:3
+    relief = "sunken"
+    repeatdelay = 400
+    repeatinterval = 100
+    selectbackground = ...  # @different:3
+    selectborderwidth = ...  # @different:2
+    selectforeground = ...  # @different:3
+    state = "normal"
+    takefocus = ""
+    textvariable = ""
+    to = 0.0
+    validate = "none"
+    validatecommand = ""
+    values = ""
+    vcmd = ""
+    width = 20
+    wrap = 0
+    xscrollcommand = ""
+
+
+class Text:
+    autoseparators = 1
+    background = ...  # @different:3
+    bd = ...  # @different:2
+    bg = ...  # @different:3
+    blockcursor = 0
+    borderwidth = ...  # @different:2
+    cursor = "xterm"
+    endline = ""
+    exportselection = 1
+    fg = ...  # @different:3
+    font = "TkFixedFont"
+    foreground = ...  # @different:3
+    height = 24
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = ...  # @different:3
+    inactiveselectbackground = ...  # @different:3
+    insertbackground = ...  # @different:3
+    insertborderwidth = 0
+    insertofftime = 300
+    insertontime = 600
+    insertunfocussed = "none"
+    insertwidth = ...  # @different:2
+    maxundo = 0
+    padx = 1
+    pady = 1
+    relief = ...  # @different:2
+    selectbackground = ...  # @different:3
+    selectborderwidth = ...  # @different:3
+    selectforeground = ...  # @different:3
+    setgrid = 0
+    spacing1 = 0
+    spacing2 = 0
+    spacing3 = 0
+    startline = ""
+    state = "normal"
+    tabs = ""
+    tabstyle = "tabular"
+    takefocus = ""
+    undo = 0
+    width = 80
+    wrap = "char"
+    xscrollcommand = ""
+    yscrollcommand = ""
+
+
+class Tk:
+    background = ...  # @different:3
+    bd = 0
+    bg = ...  # @different:3
+    borderwidth = 0
+    class_ = "Tk"
+    colormap = ""
+    container = 0
+    cursor = ""
+    height = 0
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = 0
+    menu = ""
+    padx = 0  # @typeDiff:2
+    pady = 0  # @typeDiff:2
+    relief = "flat"
+    screen = ""
+    takefocus = 0
+    use = ""
+    visual = ""
+    width = 0
+
+
+class Toplevel:
+    background = ...  # @different:3
+    bd = 0
+    bg = ...  # @different:3
+    borderwidth = 0
+    class_ = "Toplevel"
+    colormap = ""
+    container = 0
+    cursor = ""
+    height = 0
+    highlightbackground = ...  # @different:3
+    highlightcolor = ...  # @different:3
+    highlightthickness = 0
+    menu = ""
+    padx = 0  # @typeDiff:2
+    pady = 0  # @typeDiff:2
+    relief = "flat"
+    screen = ""
+    takefocus = 0
+    use = ""
+    visual = ""
+    width = 0
@@ -0,0 +1,336 @@
+# Default option values for typeshed's tkinter/ttk.pyi
+# Generated by gen_stub_defaults.py from the merged defaults
+
+class Button:
+    class_ = ""
+    command = ""
+    compound = ""
+    cursor = ""
+    default = "normal"  # @typeDiff:2
+    image = ""
+    padding = ""
+    state = "normal"  # @typeDiff:2
+    style = ""
+    takefocus = "ttk::takefocus"
+    text = ""
+    textvariable = ""
+    underline = -1
+    width = ""
+
+
+class Checkbutton:
+    class_ = ""
+    command = ""
+    compound = ""
+    cursor = ""
+    image = ""
+    offvalue = 0
+    onvalue = 1
+    padding = ""
+    state = "normal"  # @typeDiff:2
+    style = ""
+    takefocus = "ttk::takefocus"
+    text = ""
+    textvariable = ""
+    underline = -1
+    variable = ".!checkbutton"
+    width = ""
+
+
+class Combobox:
+    background = ""
+    class_ = ""
+    cursor = ""
+    exportselection = 1
+    font = "TkTextFont"  # @typeDiff:2
+    foreground = ""
+    height = 10
+    invalidcommand = ""
+    justify = "left"
+    postcommand = ""
+    show = ""
+    state = "normal"  # @typeDiff:2
+    style = ""
+    takefocus = "ttk::takefocus"
+    textvariable = ""
+    validate = "none"
+    validatecommand = ""
+    values = ""
+    width = 20
+    xscrollcommand = ""
+
+
+class Entry:
+    background = ""
+    class_ = ""
+    cursor = ...  # @different:3
+    exportselection = 1
+    font = "TkTextFont"  # @typeDiff:2
+    foreground = ""
+    invalidcommand = ""
+    justify = "left"
+    show = ""
+    state = "normal"  # @typeDiff:2
+    style = ""
+    takefocus = "ttk::takefocus"
+    textvariable = ""
+    validate = "none"
+    validatecommand = ""
+    width = 20
+    xscrollcommand = ""
+
+
+class Frame:
+    borderwidth = ""
+    class_ = ""
+    cursor = ""
+    height = 0  # @typeDiff:2
+    padding = ""
+    relief = ""
+    style = ""
+    takefocus = ""
+    width = 0  # @typeDiff:2
+
+
+class Label:
+    anchor = ...  # @different:3
+    background = ""
+    borderwidth = ""
+    class_ = ""
+    compound = ""
+    cursor = ""
+    font = ""
+    foreground = ""
+    image = ""
+    justify = ...  # @different:3
+    padding = ""
+    relief = ""
+    state = "normal"  # @typeDiff:2
+    style = ""
+    takefocus = ""
+    text = ""
+    textvariable = ""
+    underline = -1
+    width = ""
+    wraplength = ""
+
+
+class LabelFrame:
+    borderwidth = ""
+    class_ = ""
+    cursor = ""
+    height = 0  # @typeDiff:2
+    labelanchor = "nw"
+    labelwidget = ""
+    padding = ""
+    relief = ""
+    style = ""
+    takefocus = ""
+    text = ""
+    underline = -1
+    width = 0  # @typeDiff:2
+
+
+class LabeledScale:
+    borderwidth = ""
+    class_ = ""
+    cursor = ""
+    height = 0  # @typeDiff:2
+    padding = ""
+    relief = ""
+    style = ""
+    takefocus = ""
+    width = 0  # @typeDiff:2
+
+
+class Labelframe:
+    borderwidth = ""
+    class_ = ""
+    cursor = ""
+    height = 0  # @typeDiff:2
+    labelanchor = "nw"
+    labelwidget = ""
+    padding = ""
+    relief = ""
+    style = ""
+    takefocus = ""
+    text = ""
+    underline = -1
+    width = 0  # @typeDiff:2
+
+
+class Menubutton:
+    class_ = ""
+    compound = ""
+    cursor = ""
+    direction = "below"  # @typeDiff:2
+    image = ""
+    menu = ""
+    padding = ""
+    state = "normal"  # @typeDiff:2
+    style = ""
+    takefocus = "ttk::takefocus"
+    text = ""
+    textvariable = ""
+    underline = -1
+    width = ""
+
+
+class Notebook:
+    class_ = ""
+    cursor = ""
+    height = 0
+    padding = ""
+    style = ""
+    takefocus = "ttk::takefocus"
+    width = 0
+
+
+class OptionMenu:
+    class_ = ""
+    compound = ""
+    cursor = ""
+    direction = "below"  # @typeDiff:2
+    image = ""
+    menu = "@repr:<tkinter.Menu object .!optionmenu.!menu>"
+    padding = ""
+    state = "normal"  # @typeDiff:2
+    style = ""
+    takefocus = "ttk::takefocus"
+    text = ""
+    textvariable = ...  # @different:2
+    underline = -1
+    width = ""
+
+
+class PanedWindow:
+    class_ = ""
+    cursor = ""
+    height = 0
+    orient = "vertical"  # @typeDiff:2
+    style = ""
+    takefocus = ""
+    width = 0
+
+
+class Panedwindow:
+    class_ = ""
+    cursor = ""
+    height = 0
+    orient = "vertical"  # @typeDiff:2
+    style = ""
+    takefocus = ""
+    width = 0
+
+
+class Progressbar:
+    class_ = ""
+    cursor = ""
+    length = 100  # @typeDiff:2
+    maximum = 100
+    mode = "determinate"  # @typeDiff:2
+    orient = "horizontal"  # @typeDiff:2
+    phase = 0
+    style = ""
+    takefocus = ""
+    value = 0.0
+    variable = ""
+
+
+class Radiobutton:
+    class_ = ""
+    command = ""
+    compound = ""
+    cursor = ""
+    image = ""
+    padding = ""
+    state = "normal"  # @typeDiff:2
+    style = ""
+    takefocus = "ttk::takefocus"
+    text = ""
+    textvariable = ""
+    underline = -1
+    value = 1
+    variable = "::selectedButton"
+    width = ""
+
+
+class Scale:
+    class_ = ""
+    command = ""
+    cursor = ""
+    from_ = 0
+    length = 100  # @typeDiff:2
+    orient = "horizontal"  # @typeDiff:2
+    state = "normal"  # @typeDiff:2
+    style = ""
+    takefocus = "ttk::takefocus"
+    to = 1.0
+    value = 0
+    variable = ""
+
+
+class Scrollbar:
+    class_ = ""
+    command = ""
+    cursor = ""
+    orient = "vertical"  # @typeDiff:2
+    style = ""
+    takefocus = ""
+
+
+class Separator:
+    class_ = ""
+    cursor = ""
+    orient = "horizontal"  # @typeDiff:2
+    style = ""
+    takefocus = ""
+
+
+class Sizegrip:
+    class_ = ""
+    cursor = ...  # @different:3
+    style = ""
+    takefocus = ""
+
+
+class Spinbox:
+    background = ""
+    class_ = ""
+    command = ""
+    cursor = ""
+    exportselection = 1
+    font = "TkTextFont"  # @typeDiff:2
+    foreground = ""
+    format = ""
+    from_ = 0
+    increment = 1
+    invalidcommand = ""
+    justify = "left"
+    show = ""
+    state = "normal"  # @typeDiff:2
+    style = ""
+    takefocus = "ttk::takefocus"
+    textvariable = ""
+    to = 0
+    validate = "none"
+    validatecommand = ""
+    values = ""
+    width = 20
+    wrap = 0
+    xscrollcommand = ""
+
+
+class Treeview:
+    class_ = ""
+    columns = ""
+    cursor = ""
+    displaycolumns = ...
+    height = 10
+    padding = ""
+    selectmode = "extended"  # @typeDiff:2
+    show = ...  # @different:2
+    style = ""
+    takefocus = "ttk::takefocus"
+    xscrollcommand = ""
+    yscrollcommand = ""
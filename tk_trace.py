@@ -0,0 +1,256 @@
+"""Record/replay of the Tcl interpreter for display-free probing.
+
+`record` runs a probe with every Tcl interpreter created by tkinter.Tk()
+wrapped so every call into it (widget construction, configure, cget, ...)
+and its answer is saved to a compact trace. `replay` runs the probe with
+tkinter.Tk() getting a ReplayTkApp that serves the recorded answers instead
+of a real interpreter, so probe changes can be tested/benchmarked without
+a display (e.g. against traces recorded on macOS or Windows)."""
+from __future__ import annotations
+
+import argparse
+import gzip
+import importlib
+import json
+import platform
+import re
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from tkinter import TclError
+
+import _tkinter
+
+from probe_engine import ReplayTclObj, reset_tkinter_counters
+
+TRACE_DIR = Path('./traces')
+TRACE_VERSION = 1
+# module to probe -> its name in the trace filename
+PROBE_MODULES = {'get_tkinter_defaults': 'tkinter',
+                 'get_ttk_defaults.get_ttk_defaults': 'ttk',
+                 'probe_engine': 'all'}
+
+# Tcl command names made by Misc._register() start with id(func) so differ
+# between runs, e.g. '140318423424400callit' -> '#callit'
+_COMMAND_ID_RE = re.compile(r'\d{5,}(?=[A-Za-z_<])')
+
+
+def _is_tcl_obj(v: object) -> bool:
+    return isinstance(v, (_tkinter.Tcl_Obj, ReplayTclObj))
+
+
+def _encode(v: object, is_key=False):
+    """Encode a value passed to/from the Tcl interpreter as JSON"""
+    if isinstance(v, str):
+        return _COMMAND_ID_RE.sub('#', v) if is_key else v
+    if v is None or isinstance(v, (bool, int, float)):
+        return v
+    if isinstance(v, (tuple, list)):
+        return {'t': [_encode(x, is_key) for x in v]}
+    if _is_tcl_obj(v):
+        return {'o': [v.typename, _encode(v.string, is_key)]}
+    if isinstance(v, bytes):
+        return {'b': v.decode('latin-1')}
+    if callable(v):
+        return {'f': None}
+    return {'r': repr(v)}
+
+
+def _decode(v):
+    if not isinstance(v, dict):
+        return v
+    (tag, data), = v.items()
+    if tag == 't':
+        return tuple(_decode(x) for x in data)
+    if tag == 'o':
+        return ReplayTclObj(*data)
+    if tag == 'b':
+        return data.encode('latin-1')
+    return data  # 'f'/'r': can't be reconstructed
+
+
+def _call_key(method: str, args: tuple) -> str:
+    return json.dumps([method, _encode(args, is_key=True)], separators=(',', ':'))
+
+
+class RecordingTkApp:
+    """Wraps a real tkapp (Tcl interpreter) and records every method call"""
+
+    def __init__(self, tkapp, calls: dict[str, list] | None = None):
+        self._tkapp = tkapp
+        self.calls = {} if calls is None else calls
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._tkapp, name)
+        if not callable(attr):
+            return attr
+
+        def wrapper(*args):
+            answers = self.calls.setdefault(_call_key(name, args), [])
+            try:
+                result = attr(*args)
+            except TclError as e:
+                answers.append({'e': str(e)})
+                raise
+            answers.append({'v': _encode(result)})
+            return result
+        return wrapper
+
+
+class ReplayTkApp:
+    """Serves the recorded answers. Repeated calls get the answers in the
+    order they were recorded (the last one is reused once they run out)."""
+
+    def __init__(self, calls: dict[str, list]):
+        self._calls = {k: deque(v) for k, v in calls.items()}
+        self.misses: list[str] = []
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)  # e.g. Misc._windowingsystem's cache
+
+        def replay(*args):
+            key = _call_key(name, args)
+            if not (answers := self._calls.get(key)):
+                self.misses.append(key)
+                raise TclError(f'replay: no recorded answer for {key}')
+            answer = answers.popleft() if len(answers) > 1 else answers[0]
+            if 'e' in answer:
+                raise TclError(answer['e'])
+            return _decode(answer['v'])
+        return replay
+
+
+@contextmanager
+def recording():
+    """Every Tcl interpreter created by tkinter.Tk() inside this context is
+    recorded; yields the (shared) dict of recorded calls"""
+    calls = {}
+    real_create = _tkinter.create
+
+    def create(*args):
+        return RecordingTkApp(real_create(*args), calls)
+
+    _tkinter.create = create
+    reset_tkinter_counters()
+    try:
+        yield calls
+    finally:
+        _tkinter.create = real_create
+
+
+@contextmanager
+def replaying(calls: dict[str, list]):
+    """tkinter.Tk() inside this context gets a ReplayTkApp instead of a real
+    Tcl interpreter, so no display is needed. Yields the list of misses."""
+    app = ReplayTkApp(calls)
+    real_create = _tkinter.create
+    _tkinter.create = lambda *_args: app
+    reset_tkinter_counters()
+    try:
+        yield app.misses
+    finally:
+        _tkinter.create = real_create
+
+
+def save_trace(path: Path, module: str, calls: dict[str, list], result: str):
+    trace = {'version': TRACE_VERSION, 'module': module,
+             'platform': platform.platform(), 'python': platform.python_version(),
+             'result': json.loads(result), 'calls': calls}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, 'wt', encoding='utf8') as f:
+        json.dump(trace, f, separators=(',', ':'))
+
+
+def load_trace(path: Path) -> dict:
+    with gzip.open(path, 'rt', encoding='utf8') as f:
+        trace = json.load(f)
+    if trace.get('version') != TRACE_VERSION:
+        raise ValueError(f'Unsupported trace version in {path}')
+    return trace
+
+
+def record(module: str, path: Path | None = None) -> Path:
+    prober = importlib.import_module(module)
+    with recording() as calls:
+        result = prober.defaults_str()
+    if path is None:
+        py_key = f'{platform.python_implementation()}-{platform.python_version()}'
+        path = TRACE_DIR / f'{PROBE_MODULES[module]}__{py_key}_{platform.platform()}.trace.json.gz'
+    save_trace(path, module, calls, result)
+    return path
+
+
+def replay(path: Path) -> tuple[str, list[str]]:
+    """Returns (JSON output of the probe, calls that had no recorded answer)"""
+    trace = load_trace(path)
+    prober = importlib.import_module(trace['module'])
+    with replaying(trace['calls']) as misses:
+        result = prober.defaults_str()
+    return result, misses
+
+
+def compare_shared(paths: list[Path]) -> list[str]:
+    """Check that each plugin's output in a shared-session ('probe_engine')
+    trace is the same as in the standalone trace from the same platform and
+    Python. Returns the mismatches."""
+    traces = [load_trace(p) for p in paths]
+    standalone = {(t['platform'], t['python'], PROBE_MODULES[t['module']]): t['result']
+                  for t in traces if t['module'] != 'probe_engine'}
+    problems = []
+    n = 0
+    for t in traces:
+        if t['module'] != 'probe_engine':
+            continue
+        for name, defaults in t['result'].items():
+            if (expected := standalone.get((t['platform'], t['python'], name))) is None:
+                continue
+            n += 1
+            if defaults != expected:
+                diff = sorted(f'{w}.{k}' for w in set(defaults) | set(expected)
+                              for k in set(defaults.get(w, {})) | set(expected.get(w, {}))
+                              if defaults.get(w, {}).get(k) != expected.get(w, {}).get(k))
+                problems.append(f'{name} on {t["platform"]} (Python {t["python"]}): '
+                                f'shared session differs at {", ".join(diff)}')
+    print(f'Compared {n} plugin outputs')
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    sub = parser.add_subparsers(dest='cmd', required=True)
+    p = sub.add_parser('record', help='record a trace (needs a display)')
+    p.add_argument('module', choices=PROBE_MODULES)
+    p.add_argument('-o', '--out', type=Path)
+    p = sub.add_parser('replay', help='replay a trace and check the probe output')
+    p.add_argument('trace', type=Path)
+    p.add_argument('-r', '--repeat', type=int, default=1, help='for benchmarking')
+    p = sub.add_parser('compare', help='check shared-session traces against standalone ones')
+    p.add_argument('traces', type=Path, nargs='+')
+    args = parser.parse_args()
+    if args.cmd == 'record':
+        print(f'Recorded trace to {record(args.module, args.out)}')
+        return
+    if args.cmd == 'compare':
+        problems = compare_shared(args.traces)
+        for problem in problems:
+            print(problem)
+        sys.exit(1 if problems else 0)
+    expected = json.dumps(load_trace(args.trace)['result'], sort_keys=True)
+    times = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        result, misses = replay(args.trace)
+        times.append(time.perf_counter() - start)
+    for key in misses:
+        print(f'Missing answer: {key}')
+    ok = json.dumps(json.loads(result), sort_keys=True) == expected
+    print(f'{"OK" if ok else "MISMATCH"}: replayed in best {min(times) * 1e3:.1f}ms '
+          f'({len(misses)} missing answers)')
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
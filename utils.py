@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+from contextlib import contextmanager
 from os import PathLike
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 if TYPE_CHECKING:
     from typing import TypeAlias
 
@@ -38,14 +48,106 @@ def readfile_json(path: str | PathLike, mode='r') -> JsonT:
 
 
 def writefile_json(path: str | PathLike, content: JsonT | Any, mode='w', indent=2):
+    """Atomic if mode='w' (see atomic_writefile)"""
+    if mode == 'w':
+        return atomic_writefile(path, json.dumps(content, sort_keys=True, indent=indent))
     with open(path, mode, encoding='utf8') as f:
         json.dump(content, f, sort_keys=True, indent=indent)
 
 
-def _normalize_json_str(s: str):
-    # no indent so no newlines cross-platform issues
-    return json.dumps(json.loads(s), sort_keys=True)
+def atomic_writefile(path: str | PathLike, content: str):
+    """Write to a temporary file and rename it over `path` so readers
+    (and concurrent writers) never see a partially written file"""
+    path = Path(path)
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    try:
+        writefile(tmp, content)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+LOCK_SUFFIX = '.lock'
+
+
+def lock_path(path: str | PathLike) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + LOCK_SUFFIX)
+
+
+@contextmanager
+def file_lock(path: str | PathLike):
+    """Hold an exclusive advisory lock for `path` (a file or directory) while
+    in this context, blocking until other processes release it. The lock is
+    on a separate `<path>.lock` file. Not reentrant."""
+    lp = lock_path(path)
+    lp.parent.mkdir(parents=True, exist_ok=True)
+    with open(lp, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK gives up after 10s
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _normalize_floats(o: JsonT) -> JsonT:
+    if isinstance(o, float):
+        return 0.0 if o == 0.0 else o  # -0.0 -> 0.0
+    if isinstance(o, (list, tuple)):
+        return [_normalize_floats(v) for v in o]
+    if isinstance(o, dict):
+        return {k: _normalize_floats(v) for k, v in o.items()}
+    return o
+
+
+def canonical_json_bytes(content: JsonT) -> bytes:
+    """Serialization used for digests: independent of indent/newlines/key order"""
+    return json.dumps(_normalize_floats(content), sort_keys=True, separators=(',', ':'),
+                      ensure_ascii=False, allow_nan=False).encode('utf8')
+
+
+def json_digest(content: JsonT) -> str:
+    return hashlib.sha256(canonical_json_bytes(content)).hexdigest()
+
+
+DIGEST_SUFFIX = '.sha256'
+
+
+def digest_path(path: str | PathLike) -> Path:
+    path = Path(path)
+    return path.with_name(path.name + DIGEST_SUFFIX)
+
+
+def write_digest(path: str | PathLike, digest: str):
+    atomic_writefile(digest_path(path), digest + '\n')
+
+
+def file_digest(path: str | PathLike) -> str:
+    """Return the digest of the JSON file at `path`, from its sidecar if there
+    is one (otherwise it is computed once and the sidecar is written)"""
+    sidecar = digest_path(path)
+    if sidecar.exists():
+        return readfile(sidecar).strip()
+    digest = json_digest(readfile_json(path))
+    write_digest(path, digest)
+    return digest
 
 
-def json_str_eq(a: str, b: str) -> bool:
-    return _normalize_json_str(a).strip() == _normalize_json_str(b).strip()
+def writefile_json_digest(path: str | PathLike, content: JsonT | Any, mode='w', indent=2):
+    """writefile_json() and write its digest sidecar"""
+    writefile_json(path, content, mode, indent)
+    write_digest(path, json_digest(content))
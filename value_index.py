@@ -0,0 +1,165 @@
+"""Reverse index from default values to where they occur.
+
+Built during the merge from the raw snapshots: each value (normalized like
+the merge does, i.e. `_get_obj_data(v).value`) maps to its postings of
+(type, widget, option, platforms). It is stored compactly next to the
+merged files as `value_index.json`: the values are sorted (for prefix
+queries by bisection), strings are stored once in a string table and
+platform sets are shared between postings."""
+from __future__ import annotations
+
+import argparse
+import json
+from bisect import bisect_left
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from merge_defaults import _get_obj_data, snapshot_platform
+from utils import readfile_json, JsonT
+
+INDEX_NAME = 'value_index.json'
+INDEX_VERSION = 1
+MERGED_DIRS = (Path('./merged_defaults'), Path('./ttk_merged_defaults'))
+
+
+class IndexBuilder:
+    """Collects the postings of the snapshots as the merge reads them"""
+
+    def __init__(self):
+        # (value, type, widget, option) -> platforms
+        self.postings: dict[tuple[str, str, str, str], set[str]] = {}
+
+    def add(self, plat: str, widget: str, opt: str, v: JsonT):
+        typ, value = _get_obj_data(v)
+        self.postings.setdefault((value, typ, widget, opt), set()).add(plat)
+
+    def add_snapshot(self, filename: str, data: dict[str, dict[str, JsonT]]):
+        plat = snapshot_platform(filename)
+        for widget, options in data.items():
+            for opt, v in options.items():
+                self.add(plat, widget, opt, v)
+
+    def build(self) -> dict:
+        strings: dict[str, int] = {}
+        platsets: dict[tuple[int, ...], int] = {}
+
+        def sid(s: str) -> int:
+            return strings.setdefault(s, len(strings))
+
+        values: list[str] = []
+        value_postings: list[list[list[int]]] = []
+        for (value, typ, widget, opt), plats in sorted(self.postings.items()):
+            if not values or values[-1] != value:
+                values.append(value)
+                value_postings.append([])
+            # intern the platforms in sorted order (not set order) so the
+            # string ids don't depend on the hash seed
+            platset = tuple(sorted(sid(p) for p in sorted(plats)))
+            value_postings[-1].append([sid(typ), sid(widget), sid(opt),
+                                       platsets.setdefault(platset, len(platsets))])
+        return {'version': INDEX_VERSION, 'strings': list(strings),
+                'platsets': [list(ps) for ps in platsets],
+                'values': values, 'postings': value_postings}
+
+
+def build_index(snapshots: Iterable[tuple[str, dict[str, dict[str, JsonT]]]]) -> dict:
+    """Build the index from (filename, data) of each snapshot"""
+    builder = IndexBuilder()
+    for filename, data in snapshots:
+        builder.add_snapshot(filename, data)
+    return builder.build()
+
+
+class Posting(NamedTuple):
+    value: str
+    type: str
+    widget: str
+    option: str
+    platforms: tuple[str, ...]
+
+
+class ValueIndex:
+    """Queries over the value indexes of the merged dirs. Each index is only
+    read on the first query."""
+
+    def __init__(self, merged_dirs: Iterable[Path] = MERGED_DIRS):
+        self.paths = [d / INDEX_NAME for d in merged_dirs]
+        self._indexes: list[dict] | None = None
+        self._by_type: dict[str, list[tuple[int, int, int]]] | None = None
+
+    def _load(self) -> list[dict]:
+        if self._indexes is None:
+            self._indexes = []
+            for path in self.paths:
+                if not path.exists():
+                    continue
+                index = readfile_json(path)
+                if index.get('version') != INDEX_VERSION:
+                    raise ValueError(f'Unsupported value index version in {path}')
+                strings = index['strings']
+                index['platsets'] = [tuple(strings[p] for p in ps) for ps in index['platsets']]
+                self._indexes.append(index)
+        return self._indexes
+
+    def _decode(self, index: dict, i: int, j: int) -> Posting:
+        typ, widget, opt, platset = index['postings'][i][j]
+        strings = index['strings']
+        return Posting(index['values'][i], strings[typ], strings[widget], strings[opt],
+                       index['platsets'][platset])
+
+    def exact(self, value: str) -> list[Posting]:
+        out = []
+        for index in self._load():
+            values = index['values']
+            if (i := bisect_left(values, value)) < len(values) and values[i] == value:
+                out += [self._decode(index, i, j) for j in range(len(index['postings'][i]))]
+        return out
+
+    def prefix(self, prefix: str) -> list[Posting]:
+        out = []
+        for index in self._load():
+            values = index['values']
+            i = bisect_left(values, prefix)
+            while i < len(values) and values[i].startswith(prefix):
+                out += [self._decode(index, i, j) for j in range(len(index['postings'][i]))]
+                i += 1
+        return out
+
+    def of_type(self, typename: str) -> list[Posting]:
+        """Postings of values of this type (e.g. 'pixel' or '@Py_int')"""
+        if self._by_type is None:
+            self._by_type = {}
+            for k, index in enumerate(self._load()):
+                strings = index['strings']
+                for i, value_postings in enumerate(index['postings']):
+                    for j, posting in enumerate(value_postings):
+                        self._by_type.setdefault(strings[posting[0]], []).append((k, i, j))
+        return [self._decode(self._indexes[k], i, j)
+                for k, i, j in self._by_type.get(typename, ())]
+
+
+def print_postings(postings: list[Posting]):
+    for p in postings:
+        print(f'{p.widget}.{p.option} = {json.dumps(p.value)} ({p.type}): '
+              f'{len(p.platforms)} platforms')
+    print(f'{len(postings)} results')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('query')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('-p', '--prefix', action='store_true', help='values starting with query')
+    group.add_argument('-t', '--type', action='store_true', help='values of type query')
+    args = parser.parse_args()
+    index = ValueIndex()
+    if args.prefix:
+        print_postings(index.prefix(args.query))
+    elif args.type:
+        print_postings(index.of_type(args.query))
+    else:
+        print_postings(index.exact(args.query))
+
+
+if __name__ == '__main__':
+    main()
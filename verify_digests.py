@@ -0,0 +1,54 @@
+"""Check that every snapshot/merged file's digest sidecar is in sync"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import shards
+from utils import digest_path, json_digest, readfile, readfile_json, write_digest, DIGEST_SUFFIX
+
+MERGED_DIRS = (Path('./merged_defaults'), Path('./ttk_merged_defaults'))
+CHECKED_DIRS = (Path('./tkinter_defaults'), Path('./ttk_defaults'), *MERGED_DIRS,
+                *(shards.shards_dir(d) for d in MERGED_DIRS),
+                *(shards.shards_dir(d) / kind for d in MERGED_DIRS for kind in shards.KINDS))
+
+
+def verify_dir(directory: Path, write=False) -> list[str]:
+    """Return a list of problems. If `write`, also fix them."""
+    problems = []
+    for path in sorted(directory.glob('*.json')):
+        digest = json_digest(readfile_json(path))
+        sidecar = digest_path(path)
+        if not sidecar.exists():
+            problems.append(f'{path}: missing digest sidecar')
+        elif readfile(sidecar).strip() != digest:
+            problems.append(f'{path}: digest sidecar out of date')
+        else:
+            continue
+        if write:
+            write_digest(path, digest)
+    for sidecar in sorted(directory.glob('*.json' + DIGEST_SUFFIX)):
+        if not sidecar.with_name(sidecar.name[:-len(DIGEST_SUFFIX)]).exists():
+            problems.append(f'{sidecar}: digest sidecar without a file')
+            if write:
+                sidecar.unlink()
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--write', action='store_true',
+                        help='write missing/out of date sidecars instead of failing')
+    args = parser.parse_args()
+    problems = [p for d in CHECKED_DIRS if d.exists() for p in verify_dir(d, args.write)]
+    for p in problems:
+        print(p)
+    if problems and not args.write:
+        print(f'{len(problems)} problems found, run with --write to fix them')
+        sys.exit(1)
+    print(f'Fixed {len(problems)} problems' if problems else 'All digests in sync')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+"""Watch tkinter_defaults/ and ttk_defaults/ and re-merge as snapshots land.
+
+The directories are polled (there's no inotify in the stdlib) and bursts
+of changes are debounced. Only widgets whose data in the new/changed/removed
+snapshots isn't identical to another snapshot's are re-merged (as merging
+ignores duplicate values). The merged outputs are written atomically, and
+the output dir's lock is held from re-scanning the snapshots until they're
+written (like merge_defaults.merge_into) so a concurrent merge that saw more
+snapshots isn't overwritten."""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections import Counter
+from pathlib import Path
+
+from merge_defaults import _write_merged, merge_data, merge_widget, snapshot_paths
+from utils import file_lock, readfile_json, json_digest, JsonT
+from value_index import build_index
+
+POLL_INTERVAL = 0.25
+DEBOUNCE = 0.5
+
+_Stamp = tuple[int, int]  # (mtime_ns, size)
+
+
+class IncrementalMerger:
+    def __init__(self, name: str, defaults_dir: Path, out_dir: Path,
+                 sharded: bool | None = None):
+        self.name = name
+        self.defaults_dir = defaults_dir
+        self.out_dir = out_dir
+        self.sharded = sharded
+        self.snapshots: dict[str, dict[str, dict[str, JsonT]]] = {}
+        self.merged: dict[str, dict[str, JsonT]] = {}
+        self._applied: dict[str, _Stamp] = {}  # stamps of the merged snapshots
+        self._seen: dict[str, _Stamp] = {}  # stamps from the last poll
+        # widget -> how many snapshots have each version (digest) of its data
+        self._versions: dict[str, Counter[str]] = {}
+
+    def scan(self) -> dict[str, _Stamp]:
+        out = {}
+        for f in snapshot_paths(self.defaults_dir):
+            try:
+                st = f.stat()
+            except FileNotFoundError:
+                continue  # removed while scanning
+            out[f.name] = (st.st_mtime_ns, st.st_size)
+        return out
+
+    def poll(self) -> bool:
+        """Return True if anything changed since the last poll"""
+        stamps = self.scan()
+        if stamps == self._seen:
+            return False
+        self._seen = stamps
+        return True
+
+    def full_merge(self):
+        with file_lock(self.out_dir):
+            self._seen = self.scan()
+            self.snapshots = {}
+            self._versions = {}
+            self._load(self._seen.keys())
+            self.merged = merge_data(*self.snapshots.values())
+            self._write()
+
+    def _load(self, names) -> set[str]:
+        """Load the snapshots, returning the widgets that now have a new version"""
+        affected = set()
+        for name in names:
+            try:
+                data = readfile_json(self.defaults_dir / name)
+            except (OSError, json.JSONDecodeError):
+                continue  # probably still being written, retry on the next change
+            self.snapshots[name] = data
+            self._applied[name] = self._seen[name]
+            for widget, w_data in data.items():
+                versions = self._versions.setdefault(widget, Counter())
+                digest = json_digest(w_data)
+                if versions[digest] == 0:
+                    affected.add(widget)
+                versions[digest] += 1
+        return affected
+
+    def _unload(self, name: str) -> set[str]:
+        """Forget the snapshot, returning the widgets that lost a version"""
+        affected = set()
+        self._applied.pop(name, None)
+        for widget, w_data in self.snapshots.pop(name, {}).items():
+            versions = self._versions[widget]
+            digest = json_digest(w_data)
+            versions[digest] -= 1
+            if versions[digest] == 0:
+                del versions[digest]
+                affected.add(widget)
+        return affected
+
+    def update(self) -> set[str]:
+        """Re-merge the widgets affected by changes since the last update.
+        Returns the affected widgets."""
+        with file_lock(self.out_dir):
+            # re-scan under the lock so the write includes every snapshot
+            # that a concurrent merge could have seen
+            self._seen = stamps = self.scan()
+            removed = self._applied.keys() - stamps.keys()
+            changed = {n for n, st in stamps.items() if self._applied.get(n) != st}
+            affected = set()
+            for name in removed | changed:
+                affected |= self._unload(name)
+            affected |= self._load(changed)
+            for widget in affected:
+                data_ls = [d[widget] for d in self.snapshots.values() if widget in d]
+                if data_ls:
+                    self.merged[widget] = merge_widget(*data_ls)
+                else:
+                    self.merged.pop(widget, None)
+            if affected or removed or changed:
+                # even if no widget changed, the value index's platforms may have
+                self._write()
+        return affected
+
+    def _write(self):
+        """Write the outputs (the caller holds the lock)"""
+        self.out_dir.mkdir(exist_ok=True)
+        _write_merged(self.out_dir, self.merged, self.sharded,
+                      build_index(self.snapshots.items()))
+
+
+def default_mergers(sharded: bool | None = None) -> list[IncrementalMerger]:
+    return [IncrementalMerger('tkinter', Path('./tkinter_defaults'),
+                              Path('./merged_defaults'), sharded),
+            IncrementalMerger('ttk', Path('./ttk_defaults'),
+                              Path('./ttk_merged_defaults'), sharded)]
+
+
+def watch(mergers: list[IncrementalMerger], poll_interval=POLL_INTERVAL,
+          debounce=DEBOUNCE):
+    for m in mergers:
+        print(f'[{m.name}] Initial full merge')
+        m.full_merge()
+    last_change: dict[str, float] = {}
+    print('Watching for new snapshots...')
+    while True:
+        now = time.monotonic()
+        for m in mergers:
+            if m.poll():
+                last_change[m.name] = now
+            elif m.name in last_change and now - last_change[m.name] >= debounce:
+                del last_change[m.name]
+                affected = m.update()
+                print(f'[{m.name}] Re-merged {len(affected)} widgets: '
+                      f'{", ".join(sorted(affected))}')
+        time.sleep(poll_interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL,
+                        help='seconds between polls')
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE,
+                        help='seconds without changes before re-merging')
+    args = parser.parse_args()
+    try:
+        watch(default_mergers(), args.interval, args.debounce)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -1,10 +1,9 @@
-import write_curr_defaults
-import merge_defaults
-
-from get_ttk_defaults import merge_ttk_defaults, write_curr_ttk_defaults
-
-
 def main():
+    # Imported here so importing this module doesn't import tkinter
+    import write_curr_defaults
+    import merge_defaults
+    from get_ttk_defaults import merge_ttk_defaults, write_curr_ttk_defaults
+
     print('Gathering and writing tkinter defaults...')
     write_curr_defaults.run()
     print('Merging tkinter defaults...')
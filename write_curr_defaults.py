@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import json
 import platform
 import sys
 from os import PathLike
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from get_tkinter_defaults import defaults_str
-from utils import json_str_eq
+from get_tkinter_defaults import PLUGIN, defaults_str
+from probe_engine import IncompleteProbeError
+from utils import (atomic_writefile, file_digest, file_lock, json_digest,
+                   write_digest, writefile_json)
+
+if TYPE_CHECKING:
+    from isolated_probe import ProbeResult
 
 DEBUG = 1
 
@@ -17,16 +24,12 @@ def debug(msg: str, always=False, level=1):
 
 
 def _writefile(path: str | PathLike, content: str, mode='w'):
+    if mode == 'w':
+        return atomic_writefile(path, content)
     with open(path, mode) as f:
         f.write(content)
 
 
-def _readfile(path: str | PathLike, mode='r') -> str:
-    assert 'w' not in mode
-    with open(path, mode) as f:
-        return f.read()
-
-
 def get_py_key():
     ver_key = f'{sys.version_info.major}.{sys.version_info.minor}'
     return f'{platform.python_implementation()}-{ver_key}'
@@ -36,15 +39,19 @@ def get_arch_key():
     return f'{get_py_key()}_{platform.platform()}'
 
 
-OUT_PATH_FMT = 'tkinter_defaults/default{n}__{plat}.json'
+DEFAULTS_DIR = Path('./tkinter_defaults')
+OUT_NAME_FMT = 'default{n}__{plat}.json'
+INCOMPLETE_DIRNAME = 'incomplete'  # not read by the merges
 
 
-def _find_available_path(result: str, check_overwrite=True) -> tuple[Path, Path | None]:
+def _find_available_path(result: str, check_overwrite=True,
+                         out_dir: Path = DEFAULTS_DIR) -> tuple[Path, Path | None]:
     """Return tuple of (path of result [NOT None], path to write to [or None])"""
     def get_out_path():
-        return Path(OUT_PATH_FMT.format(n=n, plat=plat))
+        return out_dir / OUT_NAME_FMT.format(n=n, plat=plat)
 
     plat = get_arch_key()
+    result_digest = json_digest(json.loads(result))
     n = 0
     out_path = get_out_path()
     if not check_overwrite:
@@ -53,8 +60,7 @@ def _find_available_path(result: str, check_overwrite=True) -> tuple[Path, Path
         if not out_path.exists():
             print(f'[DEBUG] Found space at {n=}')
             return out_path, out_path  # free path, write here
-        orig = _readfile(out_path)
-        if json_str_eq(orig, result):
+        if file_digest(out_path) == result_digest:
             # same result so no write but still return path to find it at
             print(f'[DEBUG] Found matching at {n=}')
             return out_path, None
@@ -66,16 +72,43 @@ def _find_available_path(result: str, check_overwrite=True) -> tuple[Path, Path
                        "(should never be THIS many of a single platform)")
 
 
+def write_snapshot(out_dir: Path, defaults_s: str, check_overwrite=True) -> Path:
+    """Write the snapshot to `out_dir` unless it's already there; return its path"""
+    # Lock so concurrent collectors can't pick the same default{n} slot
+    with file_lock(out_dir):
+        res_path, out_path = _find_available_path(defaults_s, check_overwrite, out_dir)
+        if out_path is not None:
+            debug(f'INFO: Writing defaults to {out_dir.name}/')
+            _writefile(out_path, defaults_s)
+            write_digest(out_path, json_digest(json.loads(defaults_s)))
+        else:
+            debug(f'INFO: No write to {out_dir.name}/ needed (same as existing info)')
+    return res_path
+
+
+def write_incomplete_snapshot(out_dir: Path, result: ProbeResult) -> Path:
+    """Write the partial defaults of an incomplete (isolated) probe, and why
+    each missing class is missing, to `out_dir/incomplete/` instead of as a
+    `default{n}` snapshot so they aren't merged as if they were complete"""
+    content = {'failures': result.failures, 'defaults': result.defaults}
+    out_dir = out_dir / INCOMPLETE_DIRNAME
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_path = out_dir / f'incomplete_{json_digest(content)[:12]}__{get_arch_key()}.json'
+    writefile_json(out_path, content, indent=4)
+    return out_path
+
+
 def run(check_overwrite=True):
-    defaults_s = defaults_str()
+    try:
+        defaults_s = defaults_str()
+    except IncompleteProbeError as e:
+        path = write_incomplete_snapshot(DEFAULTS_DIR, e.results[PLUGIN.name])
+        debug(f'##[warn]WARN: Probe was incomplete, partial defaults are in {path}',
+              always=True)
+        raise
     debug('INFO: Writing defaults locally')
     _writefile('tkinter_defaults_curr.json', defaults_s)
-    res_path, out_path = _find_available_path(defaults_s, check_overwrite)
-    if out_path is not None:
-        debug('INFO: Writing defaults to tkinter_defaults/')
-        _writefile(out_path, defaults_s)
-    else:
-        debug('INFO: No write to tkinter_defaults/ needed (same as existing info)')
+    res_path = write_snapshot(DEFAULTS_DIR, defaults_s, check_overwrite)
     debug('Writing curr_out_filename.txt')
     _writefile('curr_out_filename.txt', content=res_path.name)
 
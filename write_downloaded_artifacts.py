@@ -6,7 +6,8 @@ import sys
 import warnings
 from pathlib import Path
 
-from utils import readfile_json, writefile_json, writefile, JsonT, readfile, json_str_eq
+from utils import (readfile_json, writefile_json_digest, writefile, JsonT, readfile,
+                   file_digest, file_lock, json_digest)
 
 
 ARTIFACTS_DIR = Path("./downloaded_artifacts")
@@ -32,14 +33,16 @@ def get_artifacts() -> dict[str, JsonT]:
 
 
 def write_artifact(name: str, data: JsonT):
-    path = DEFAULTS_OUT_DIR / name
-    if not path.exists():
-        print(f'Writing artifact to {path}')
-        return writefile_json(path, data, mode='x')
+    # Lock so a collector can't take this slot between the check and the write
+    with file_lock(DEFAULTS_OUT_DIR):
+        path = DEFAULTS_OUT_DIR / name
+        if not path.exists():
+            print(f'Writing artifact to {path}')
+            return writefile_json_digest(path, data)
     assert path.is_file()
-    would_write = json.dumps(data)
-    if json_str_eq(would_write, readfile(path)):
+    if file_digest(path) == json_digest(data):
         return
+    would_write = json.dumps(data)
     warnings.warn(RuntimeWarning(
         "Tried to write artifact to file that already exists and if different!"
         " This is a BUG in the write_curr_defaults.py! Dumping artifact."))